@@ -19,6 +19,7 @@ if platform.system().startswith(("Windows", "MSYS", "CYGWIN", "MINGW")):
 from amplpy.ampl import OutputHandler, Kind
 from amplpy.ampl import ErrorHandler
 from amplpy.ampl import AMPLException, PresolveException, InfeasibilityException
+from amplpy.ampl import SolveTimeoutError
 from amplpy.ampl import EntityMap
 from amplpy.ampl import Objective
 from amplpy.ampl import Variable
@@ -27,10 +28,12 @@ from amplpy.ampl import Set
 from amplpy.ampl import Parameter
 from amplpy.ampl import Entity
 from amplpy.ampl import DataFrame, Row, Column
+from amplpy.ampl import IndexMap
 from .utils import add_to_path, multidict, register_magics
 from amplpy.ampl import Environment
 from amplpy.ampl import AMPL
 from amplpy.ampl import logger
+from .pool import AMPLPool, AMPLTemplate
 
 _parent_dir = os.path.abspath(os.path.dirname(__file__))
 _vendor_dir = os.path.join(_parent_dir, "vendor")
@@ -76,6 +79,7 @@ def _list_aliases():
         Row,
         Column,
         DataFrame,
+        IndexMap,
         Environment,
         AMPL,
     ]
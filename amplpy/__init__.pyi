@@ -1,9 +1,13 @@
 from typing import (
     Any,
+    Awaitable,
+    Callable,
+    ContextManager,
     Dict,
     Hashable,
     List,
     Iterable,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -27,6 +31,9 @@ class Entity:
     def __getitem__(self, index: AMPLTuple) -> Entity: ...
     def get(self, *index: AMPLTuple) -> Entity: ...
     def find(self, index: AMPLTuple) -> Optional[Entity]: ...
+    def find_many(self, keys: Iterable[AMPLTuple]) -> Tuple[Any, Any]: ...
+    def items(self, suffix: Optional[str] = None, chunk_size: int = 65536) -> Iterator[Tuple[AMPLTuple, AMPLVariant]]: ...
+    def findMany(self, keys: Iterable[AMPLTuple]) -> Tuple[Any, Any]: ...
     def instances(self) -> Iterable[Entity]: ...
     def name(self) -> str: ...
     def indexarity(self) -> int: ...
@@ -39,6 +46,15 @@ class Entity:
     def xref(self) -> List[Optional[str]]: ...
     def get_values(self, suffixes: Optional[Union[str, Iterable[str]]] = None) -> Any: ...
     def getValues(self, suffixes: Optional[Union[str, Iterable[str]]] = None) -> Any: ...
+    def index_map(self, keys: Optional[Iterable[AMPLTuple]] = None) -> IndexMap: ...
+    def indexMap(self, keys: Optional[Iterable[AMPLTuple]] = None) -> IndexMap: ...
+    def get_array(self, index_map: IndexMap, suffix: Optional[str] = None) -> Any: ...
+    def getArray(self, index_map: IndexMap, suffix: Optional[str] = None) -> Any: ...
+    def get_suffix_arrays(self, suffixes: Union[str, Iterable[str]]) -> Tuple[Any, Dict[str, Any]]: ...
+    def getSuffixArrays(self, suffixes: Union[str, Iterable[str]]) -> Tuple[Any, Dict[str, Any]]: ...
+    def to_numpy(self, suffix: Optional[str] = None, fill: Any = ...) -> Tuple[Any, List[Any]]: ...
+    def to_arrow(self) -> Any: ...
+    def to_polars(self) -> Any: ...
     def to_pandas(self, **kwargs: Any) -> pd.DataFrame: ...
     def to_dict(self, **kwargs: Any) -> Dict[Hashable, Any]: ...
     def to_list(self, **kwargs: Any) -> List[Union[Any, Tuple[Any, ...]]]: ...
@@ -47,6 +63,13 @@ class Entity:
     def set_suffix(self, suffix: str, value: Union[float, str, DataFrame, pd.DataFrame, pd.Series]) -> None: ...
     def expand(self) -> str: ...
 
+class IndexMap:
+    def __len__(self) -> int: ...
+    def __contains__(self, key: AMPLTuple) -> bool: ...
+    def name(self) -> str: ...
+    def keys(self) -> List[Union[Any, Tuple[Any, ...]]]: ...
+    def position(self, key: AMPLTuple) -> int: ...
+
 class Constraint(Entity):
     def __setitem__(self, index: AMPLTuple, value: float) -> None: ...
     def is_logical(self) -> bool: ...
@@ -87,6 +110,8 @@ class Objective(Entity):
 
 class Parameter:
     def __setitem__(self, index: AMPLTuple, value: AMPLVariant) -> None: ...
+    def get_many(self, keys: Iterable[AMPLTuple]) -> Any: ...
+    def getMany(self, keys: Iterable[AMPLTuple]) -> Any: ...
     def is_symbolic(self) -> bool: ...
     def isSymbolic(self) -> bool: ...
     def has_default(self) -> bool: ...
@@ -94,8 +119,11 @@ class Parameter:
     def __getitem__(self, index: AMPLTuple) -> AMPLVariant: ...
     def value(self) -> AMPLVariant: ...
     def set(self, *args: Any) -> None: ...
-    def set_values(self, values: Any) -> None: ...
-    def setValues(self, values: Any) -> None: ...
+    def set_array(self, index_map: IndexMap, values: Any) -> None: ...
+    def setArray(self, index_map: IndexMap, values: Any) -> None: ...
+    def set_values(self, values: Any, labels: Optional[Sequence[Sequence[AMPLVariant]]] = None) -> None: ...
+    def setValues(self, values: Any, labels: Optional[Sequence[Sequence[AMPLVariant]]] = None) -> None: ...
+    def sync(self, values: Any) -> int: ...
 
 class Set:
     def __setitem__(self, index: Any, value: Any) -> None: ...
@@ -117,6 +145,12 @@ class Variable(Entity):
     def unfix(self) -> None: ...
     def set_value(self, value: Union[float, int, Parameter]) -> None: ...
     def setValue(self, value: Union[float, int, Parameter]) -> None: ...
+    def fix_many(self, keys: Union[IndexMap, Iterable[AMPLTuple], Any], values: Optional[Any] = None) -> None: ...
+    def fixMany(self, keys: Union[IndexMap, Iterable[AMPLTuple], Any], values: Optional[Any] = None) -> None: ...
+    def unfix_many(self, keys: Union[IndexMap, Iterable[AMPLTuple], Any]) -> None: ...
+    def unfixMany(self, keys: Union[IndexMap, Iterable[AMPLTuple], Any]) -> None: ...
+    def set_values_array(self, keys: Union[IndexMap, Iterable[AMPLTuple], Any], values: Any) -> None: ...
+    def setValuesArray(self, keys: Union[IndexMap, Iterable[AMPLTuple], Any], values: Any) -> None: ...
     def astatus(self) -> str: ...
     def defeqn(self) -> int: ...
     def dual(self) -> float: ...
@@ -157,6 +191,9 @@ class Variables:
     @overload
     def __setitem__(self, name: str, value: Mapping[Any, float]) -> None: ...
     def __setitem__(self, name: str, value: Union[float, Iterable[float], Mapping[Any, float]]) -> None: ...
+    def __contains__(self, name: str) -> bool: ...
+    def keys(self) -> List[str]: ...
+    def items(self) -> List[Tuple[str, Variable]]: ...
 
 class Constraints:
     def __getitem__(self, name: str) -> Constraint: ...
@@ -167,15 +204,24 @@ class Constraints:
     @overload
     def __setitem__(self, name: str, value: Mapping[Any, float]) -> None: ...
     def __setitem__(self, name: str, value: Union[float, Iterable[float], Mapping[Any, float]]) -> None: ...
+    def __contains__(self, name: str) -> bool: ...
+    def keys(self) -> List[str]: ...
+    def items(self) -> List[Tuple[str, Constraint]]: ...
 
 class Objectives:
     def __getitem__(self, name: str) -> Objective: ...
     def __iter__(self) -> Iterable[Objective]: ...
+    def __contains__(self, name: str) -> bool: ...
+    def keys(self) -> List[str]: ...
+    def items(self) -> List[Tuple[str, Objective]]: ...
 
 class Sets:
     def __getitem__(self, name: str) -> Set: ...
     def __setitem__(self, name: str, values: Iterable[Any]) -> None: ...
     def __iter__(self) -> Iterable[Set]: ...
+    def __contains__(self, name: str) -> bool: ...
+    def keys(self) -> List[str]: ...
+    def items(self) -> List[Tuple[str, Set]]: ...
 
 class Parameters:
     def __getitem__(self, name: str) -> Parameter: ...
@@ -189,6 +235,9 @@ class Parameters:
     def __setitem__(self, name: str, value: Iterable[float]) -> None: ...
     def __setitem__(self, name: str, value: Union[float, str, Mapping[Any, float], Iterable[Tuple[Any, float]], Iterable[float]]) -> None: ...
     def __iter__(self) -> Iterable[Parameter]: ...
+    def __contains__(self, name: str) -> bool: ...
+    def keys(self) -> List[str]: ...
+    def items(self) -> List[Tuple[str, Parameter]]: ...
 
 class Options:
     def __getitem__(self, name: str) -> Optional[Union[int, float, str]]: ...
@@ -216,6 +265,10 @@ class ErrorHandler:
     def error(self, exception: type[BaseException]) -> None: ...
     def warning(self, exception: type[BaseException]) -> None: ...
 
+class SolveTimeoutError(TimeoutError):
+    output: Optional[str]
+    def __init__(self, message: str, output: Optional[str] = None) -> None: ...
+
 class AMPL:
     var: Variables
     con: Constraints
@@ -224,6 +277,10 @@ class AMPL:
     param: Parameters
     option: Options
     def __init__(self, environment: Optional[Environment] = None) -> None: ...
+    @staticmethod
+    def from_template(template: AMPLTemplate) -> AMPL: ...
+    @staticmethod
+    def fromTemplate(template: AMPLTemplate) -> AMPL: ...
     def get_data(self, statements: Sequence[str]) -> DataFrame: ...
     def getData(self, statements: Sequence[str]) -> DataFrame: ...
     def get_entity(self, name: str) -> Entity: ...
@@ -238,6 +295,10 @@ class AMPL:
     def getSet(self, name: str) -> Set: ...
     def get_parameter(self, name: str) -> Parameter: ...
     def getParameter(self, name: str) -> Parameter: ...
+    def enable_entity_cache(self, enabled: bool = True) -> None: ...
+    def enableEntityCache(self, enabled: bool = True) -> None: ...
+    def entity_cache_info(self) -> Dict[str, Union[int, bool]]: ...
+    def entityCacheInfo(self) -> Dict[str, Union[int, bool]]: ...
     def eval(self, statements: str) -> None: ...
     def get_output(self, statements: str) -> str: ...
     def getOutput(self, statements: str) -> str: ...
@@ -245,7 +306,18 @@ class AMPL:
     def close(self) -> None: ...
     def is_running(self) -> bool: ...
     def isRunning(self) -> bool: ...
-    def solve(self, problem: Optional[str] = "", solver: Optional[str] = "", verbose: bool = True, return_output: bool = False, **kwargs: Any) -> None: ...
+    def solve(self, problem: Optional[str] = "", solver: Optional[str] = "", verbose: bool = True, return_output: bool = False, timeout: Optional[float] = None, **kwargs: Any) -> Optional[str]: ...
+    def interrupt(self) -> None: ...
+    def solve_async(self, problem: Optional[str] = "", solver: Optional[str] = "", **kwargs: Any) -> Awaitable[None]: ...
+    def solveAsync(self, problem: Optional[str] = "", solver: Optional[str] = "", **kwargs: Any) -> Awaitable[None]: ...
+    def eval_async(self, statements: str) -> Awaitable[None]: ...
+    def evalAsync(self, statements: str) -> Awaitable[None]: ...
+    def read_async(self, filename: str) -> Awaitable[None]: ...
+    def readAsync(self, filename: str) -> Awaitable[None]: ...
+    def read_data_async(self, filename: str) -> Awaitable[None]: ...
+    def readDataAsync(self, filename: str) -> Awaitable[None]: ...
+    def is_busy(self) -> bool: ...
+    def isBusy(self) -> bool: ...
     def cd(self, path: Optional[str] = None) -> str: ...
     def set_option(self, name: str, value: Union[bool, int, float, str]) -> None: ...
     def setOption(self, name: str, value: Union[bool, int, float, str]) -> None: ...
@@ -322,3 +394,19 @@ class AMPL:
     ) -> None: ...
     def toString(self) -> str: ...
     def __str__(self) -> str: ...
+
+class AMPLPool:
+    def __init__(self, size: Optional[int] = None, init: Optional[Union[Callable[[AMPL], None], str, Sequence[str]]] = None, reset: Optional[str] = "data", environment: Optional[Environment] = None) -> None: ...
+    def __len__(self) -> int: ...
+    def __enter__(self) -> AMPLPool: ...
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None: ...
+    def session(self) -> ContextManager[AMPL]: ...
+    def map(self, fn: Callable[[AMPL, Any], Any], scenarios: Iterable[Any]) -> List[Any]: ...
+    def close(self) -> None: ...
+
+class AMPLTemplate:
+    def __init__(self, init: Optional[Union[Callable[[AMPL], None], str, Sequence[str]]] = None, prespawn: int = 1, environment: Optional[Environment] = None) -> None: ...
+    def __enter__(self) -> AMPLTemplate: ...
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None: ...
+    def new_session(self) -> AMPL: ...
+    def close(self) -> None: ...
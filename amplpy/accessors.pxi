@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+
+cdef class _EntityAccessor(object):
+    """
+    Base class of the accessors :attr:`~amplpy.AMPL.var`,
+    :attr:`~amplpy.AMPL.con`, :attr:`~amplpy.AMPL.obj`,
+    :attr:`~amplpy.AMPL.set` and :attr:`~amplpy.AMPL.param`, which give
+    dictionary-like access to the entities of each type by name.
+    """
+    cdef AMPL _ampl
+    cdef campl.AMPL_ENTITYTYPE _entity_class
+
+    def __contains__(self, name):
+        return self._ampl._has_entity(name, self._entity_class)
+
+    def __iter__(self):
+        return EntityMap.create(self._ampl, self._entity_class)
+
+    def keys(self):
+        """
+        Get the names of the entities declared.
+        """
+        return [name for name, _ in self.items()]
+
+    def items(self):
+        """
+        Get a list of ``(name, entity)`` pairs with the entities declared.
+        """
+        return list(EntityMap.create(self._ampl, self._entity_class))
+
+
+cdef class Variables(_EntityAccessor):
+    """
+    Get/Set a variable.
+    """
+
+    @staticmethod
+    cdef create(AMPL ampl):
+        accessor = Variables()
+        accessor._ampl = ampl
+        accessor._entity_class = campl.AMPL_VARIABLE
+        return accessor
+
+    def __getitem__(self, name):
+        return self._ampl.get_variable(name)
+
+    def __setitem__(self, name, value):
+        if isinstance(value, Real):
+            self._ampl.get_variable(name).set_value(value)
+        else:
+            self._ampl.get_variable(name).set_values(value)
+
+
+cdef class Constraints(_EntityAccessor):
+    """
+    Get/Set a constraint.
+    """
+
+    @staticmethod
+    cdef create(AMPL ampl):
+        accessor = Constraints()
+        accessor._ampl = ampl
+        accessor._entity_class = campl.AMPL_CONSTRAINT
+        return accessor
+
+    def __getitem__(self, name):
+        return self._ampl.get_constraint(name)
+
+    def __setitem__(self, name, value):
+        if isinstance(value, Real):
+            self._ampl.get_constraint(name).set_dual(value)
+        else:
+            self._ampl.get_constraint(name).set_values(value)
+
+
+cdef class Objectives(_EntityAccessor):
+    """
+    Get an objective.
+    """
+
+    @staticmethod
+    cdef create(AMPL ampl):
+        accessor = Objectives()
+        accessor._ampl = ampl
+        accessor._entity_class = campl.AMPL_OBJECTIVE
+        return accessor
+
+    def __getitem__(self, name):
+        return self._ampl.get_objective(name)
+
+
+cdef class Sets(_EntityAccessor):
+    """
+    Get/Set a set.
+    """
+
+    @staticmethod
+    cdef create(AMPL ampl):
+        accessor = Sets()
+        accessor._ampl = ampl
+        accessor._entity_class = campl.AMPL_SET
+        return accessor
+
+    def __getitem__(self, name):
+        return self._ampl.get_set(name)
+
+    def __setitem__(self, name, values):
+        self._ampl.get_set(name).set_values(values)
+
+
+cdef class Parameters(_EntityAccessor):
+    """
+    Get/Set a parameter.
+    """
+
+    @staticmethod
+    cdef create(AMPL ampl):
+        accessor = Parameters()
+        accessor._ampl = ampl
+        accessor._entity_class = campl.AMPL_PARAMETER
+        return accessor
+
+    def __getitem__(self, name):
+        return self._ampl.get_parameter(name)
+
+    def __setitem__(self, name, value):
+        if isinstance(value, (Real, str)):
+            self._ampl.get_parameter(name).set(value)
+        else:
+            self._ampl.get_parameter(name).set_values(value)
+
+
+cdef class Options(object):
+    """
+    Get/Set an option.
+    """
+    cdef AMPL _ampl
+
+    @staticmethod
+    cdef create(AMPL ampl):
+        accessor = Options()
+        accessor._ampl = ampl
+        return accessor
+
+    def __getitem__(self, name):
+        return self._ampl.get_option(name)
+
+    def __setitem__(self, name, value):
+        if isinstance(value, dict):
+            if name.endswith("_options"):
+                self._ampl.set_option(name, " ".join(f"{k}={int(v) if isinstance(v, builtins.bool) else v}" for k, v in value.items()))
+        else:
+            self._ampl.set_option(name, value)
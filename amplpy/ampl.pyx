@@ -16,16 +16,19 @@ from numbers import Real
 from ast import literal_eval
 
 include "util.pxi" # must be first
+include "accessors.pxi"
 include "constraint.pxi"
 include "dataframe.pxi"
 include "entity.pxi"
 include "environment.pxi"
 include "errorhandler.pxi"
 include "exceptions.pxi"
+include "indexmap.pxi"
 include "iterators.pxi"
 include "objective.pxi"
 include "outputhandler.pxi"
 include "parameter.pxi"
+include "runnable.pxi"
 include "set.pxi"
 include "variable.pxi"
 
@@ -107,6 +110,13 @@ cdef class AMPL:
     cdef object _output_handler
     cdef object _error_handler
     cdef object _error_handler_wrapper
+    cdef dict _param_shadows
+    cdef dict _instance_indexes
+    cdef size_t _data_version
+    cdef object _pending_call
+    cdef dict _entity_cache
+    cdef size_t _entity_cache_hits
+    cdef size_t _entity_cache_misses
 
     def __init__(self, environment=None):
         """
@@ -123,6 +133,8 @@ cdef class AMPL:
             translator cannot be started for any other reason.
         """
         cdef Environment env
+        self._param_shadows = {}
+        self._instance_indexes = {}
         try:
             if environment is None and os.name == "nt":
                 environment = Environment()
@@ -151,6 +163,23 @@ cdef class AMPL:
         """
         self.close()
 
+    @staticmethod
+    def from_template(template):
+        """
+        Get a new AMPL object with the model and data of an
+        :class:`~amplpy.AMPLTemplate`, taken from the sessions that the
+        template keeps ready. This is only fast while ready sessions remain;
+        otherwise it waits until the template has started a new session and
+        loaded the model into it.
+
+        Args:
+            template: The :class:`~amplpy.AMPLTemplate` to use.
+
+        Returns:
+            A new AMPL object, owned by the caller.
+        """
+        return template.new_session()
+
     def get_data(self, *statements):
         """
         Get the data corresponding to the display statements. The statements
@@ -183,12 +212,15 @@ cdef class AMPL:
             DataFrame capturing the output of the display
             command in tabular form.
         """
+        self._check_idle()
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_DATAFRAME* data
         cdef char** statements_c = <char**> malloc(len(statements) * sizeof(char*))
         for i in range(len(statements)):
             statements_c[i] = strdup(statements[i].encode('utf-8'))
-        errorinfo = campl.AMPL_GetData(self._c_ampl, <const char* const*>statements_c, len(statements), &data)
+        cdef size_t n = len(statements)
+        with nogil:
+            errorinfo = campl.AMPL_GetData(self._c_ampl, <const char* const*>statements_c, n, &data)
         for i in range(len(statements)):
             free(statements_c[i])
         free(statements_c)
@@ -210,8 +242,11 @@ cdef class AMPL:
         Returns:
             The AMPL entity with the specified name.
         """
+        entity = self._cached_entity(name, -1)
+        if entity is not None:
+            return entity
         cdef char* name_c = strdup(name.encode('utf-8'))
-        return Entity.create(self, name_c, NULL, None)
+        return self._cache_entity(name, -1, Entity.create(self, name_c, NULL, None))
 
     def get_variable(self, name):
         """
@@ -225,6 +260,9 @@ cdef class AMPL:
         """
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_ENTITYTYPE entitytype
+        entity = self._cached_entity(name, campl.AMPL_VARIABLE)
+        if entity is not None:
+            return entity
         cdef char* name_c = strdup(name.encode('utf-8'))
         errorinfo = campl.AMPL_EntityGetType(self._c_ampl, name_c, &entitytype)
         if errorinfo:
@@ -233,7 +271,7 @@ cdef class AMPL:
         if entitytype != campl.AMPL_VARIABLE:
             free(name_c)
             raiseKeyError(campl.AMPL_VARIABLE, name)
-        return Variable.create(self, name_c, NULL, None)
+        return self._cache_entity(name, campl.AMPL_VARIABLE, Variable.create(self, name_c, NULL, None))
 
     def get_constraint(self, name):
         """
@@ -247,6 +285,9 @@ cdef class AMPL:
         """
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_ENTITYTYPE entitytype
+        entity = self._cached_entity(name, campl.AMPL_CONSTRAINT)
+        if entity is not None:
+            return entity
         cdef char* name_c = strdup(name.encode('utf-8'))
         errorinfo = campl.AMPL_EntityGetType(self._c_ampl, name_c, &entitytype)
         if errorinfo:
@@ -255,7 +296,7 @@ cdef class AMPL:
         if entitytype != campl.AMPL_CONSTRAINT:
             free(name_c)
             raiseKeyError(campl.AMPL_CONSTRAINT, name)
-        return Constraint.create(self, name_c, NULL, None)
+        return self._cache_entity(name, campl.AMPL_CONSTRAINT, Constraint.create(self, name_c, NULL, None))
 
     def get_objective(self, name):
         """
@@ -269,6 +310,9 @@ cdef class AMPL:
         """
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_ENTITYTYPE entitytype
+        entity = self._cached_entity(name, campl.AMPL_OBJECTIVE)
+        if entity is not None:
+            return entity
         cdef char* name_c = strdup(name.encode('utf-8'))
         errorinfo = campl.AMPL_EntityGetType(self._c_ampl, name_c, &entitytype)
         if errorinfo:
@@ -277,7 +321,7 @@ cdef class AMPL:
         if entitytype != campl.AMPL_OBJECTIVE:
             free(name_c)
             raiseKeyError(campl.AMPL_OBJECTIVE, name)
-        return Objective.create(self, name_c, NULL, None)
+        return self._cache_entity(name, campl.AMPL_OBJECTIVE, Objective.create(self, name_c, NULL, None))
 
     def get_set(self, name):
         """
@@ -291,6 +335,9 @@ cdef class AMPL:
         """
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_ENTITYTYPE entitytype
+        entity = self._cached_entity(name, campl.AMPL_SET)
+        if entity is not None:
+            return entity
         cdef char* name_c = strdup(name.encode('utf-8'))
         errorinfo = campl.AMPL_EntityGetType(self._c_ampl, name_c, &entitytype)
         if errorinfo:
@@ -299,7 +346,7 @@ cdef class AMPL:
         if entitytype != campl.AMPL_SET:
             free(name_c)
             raiseKeyError(campl.AMPL_SET, name)
-        return Set.create(self, name_c, NULL, None)
+        return self._cache_entity(name, campl.AMPL_SET, Set.create(self, name_c, NULL, None))
 
     def get_parameter(self, name):
         """
@@ -313,6 +360,9 @@ cdef class AMPL:
         """
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_ENTITYTYPE entitytype
+        entity = self._cached_entity(name, campl.AMPL_PARAMETER)
+        if entity is not None:
+            return entity
         cdef char* name_c = strdup(name.encode('utf-8'))
         errorinfo = campl.AMPL_EntityGetType(self._c_ampl, name_c, &entitytype)
         if errorinfo:
@@ -321,7 +371,98 @@ cdef class AMPL:
         if entitytype != campl.AMPL_PARAMETER:
             free(name_c)
             raiseKeyError(campl.AMPL_PARAMETER, name)
-        return Parameter.create(self, name_c, NULL, None)
+        return self._cache_entity(name, campl.AMPL_PARAMETER, Parameter.create(self, name_c, NULL, None))
+
+    def enable_entity_cache(self, enabled=True):
+        """
+        Enable (or disable) the cache of entity objects. When enabled,
+        :func:`~amplpy.AMPL.get_variable`, :func:`~amplpy.AMPL.get_parameter`
+        and the other entity getters (including the accessors such as
+        ``ampl.param[name]``) return the same object for repeated lookups of
+        a name instead of querying the interpreter each time.
+
+        The cache is cleared automatically whenever the declarations may
+        change: after :func:`~amplpy.AMPL.eval`,
+        :func:`~amplpy.AMPL.get_output`, :func:`~amplpy.AMPL.read`,
+        :func:`~amplpy.AMPL.read_data` and :func:`~amplpy.AMPL.reset`.
+        Enabling or disabling the cache resets its counters.
+
+        Args:
+            enabled: ``True`` to enable the cache, ``False`` to disable it.
+        """
+        self._entity_cache = {} if enabled else None
+        self._entity_cache_hits = 0
+        self._entity_cache_misses = 0
+
+    def entity_cache_info(self):
+        """
+        Get the statistics of the entity cache (see
+        :func:`~amplpy.AMPL.enable_entity_cache`).
+
+        Returns:
+            A dictionary with the number of ``hits`` and ``misses`` since the
+            cache was enabled, the current ``size`` of the cache, and whether
+            it is ``enabled``.
+        """
+        return {
+            "hits": self._entity_cache_hits,
+            "misses": self._entity_cache_misses,
+            "size": len(self._entity_cache) if self._entity_cache is not None else 0,
+            "enabled": self._entity_cache is not None,
+        }
+
+    cdef _cached_entity(self, name, int entitytype):
+        self._check_idle()
+        if self._entity_cache is None:
+            return None
+        entity = self._entity_cache.get((entitytype, name))
+        if entity is None:
+            self._entity_cache_misses += 1
+        else:
+            self._entity_cache_hits += 1
+        return entity
+
+    cdef _cache_entity(self, name, int entitytype, entity):
+        if self._entity_cache is not None:
+            self._entity_cache[(entitytype, name)] = entity
+        return entity
+
+    cdef str _unused_name(self, prefix):
+        """
+        Get a name starting with ``prefix`` that is not declared in AMPL.
+        """
+        name = prefix
+        i = 0
+        while not self._has_entity(name, campl.AMPL_UNDEFINED):
+            i += 1
+            name = f"{prefix}{i}"
+        return name
+
+    cdef bint _has_entity(self, name, campl.AMPL_ENTITYTYPE entitytype):
+        self._check_idle()
+        cdef campl.AMPL_ENTITYTYPE found
+        cdef bytes name_b = name.encode('utf-8')
+        PY_AMPL_CALL(campl.AMPL_EntityGetType(self._c_ampl, name_b, &found))
+        return found == entitytype
+
+    cdef _check_idle(self):
+        if self._pending_call is not None:
+            raise RuntimeError(
+                "The AMPL object is busy with an asynchronous operation; "
+                "wait for it to finish or interrupt it first"
+            )
+
+    cdef _clear_data_caches(self):
+        self._param_shadows.clear()
+        self._clear_instance_indexes()
+
+    cdef _clear_instance_indexes(self):
+        self._instance_indexes.clear()
+        self._data_version += 1
+
+    cdef _clear_entity_cache(self):
+        if self._entity_cache is not None:
+            self._entity_cache.clear()
 
     def eval(self, statements):
         """
@@ -349,10 +490,18 @@ cdef class AMPL:
           if it does not end with semicolon) or if the underlying
           interpreter is not running.
         """
+        self._check_idle()
         # Workaround for #56
         if not statements.endswith((" ", ";", "\n")):
             statements += "\n"
-        PY_AMPL_CALL(campl.AMPL_Eval(self._c_ampl, statements.encode('utf-8')))
+        self._clear_data_caches()
+        self._clear_entity_cache()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef bytes statements_b = statements.encode('utf-8')
+        cdef const char* statements_c = statements_b
+        with nogil:
+            errorinfo = campl.AMPL_Eval(self._c_ampl, statements_c)
+        PY_AMPL_CALL(errorinfo)
         self._error_handler_wrapper.check()
 
     def get_output(self, statements):
@@ -367,11 +516,19 @@ cdef class AMPL:
         Returns:
           A string with the output.
         """
+        self._check_idle()
         # Workaround for #56
         if not statements.endswith((" ", ";", "\n")):
             statements += "\n"
+        cdef campl.AMPL_ERRORINFO* errorinfo
         cdef char* output_c
-        PY_AMPL_CALL(campl.AMPL_GetOutput(self._c_ampl, statements.encode('utf-8'), &output_c))
+        cdef bytes statements_b = statements.encode('utf-8')
+        cdef const char* statements_c = statements_b
+        self._clear_data_caches()
+        self._clear_entity_cache()
+        with nogil:
+            errorinfo = campl.AMPL_GetOutput(self._c_ampl, statements_c, &output_c)
+        PY_AMPL_CALL(errorinfo)
         output = str(output_c.decode('utf-8'))
         campl.AMPL_StringFree(&output_c)
         return output
@@ -381,6 +538,9 @@ cdef class AMPL:
         Clears all entities in the underlying AMPL interpreter, clears all maps
         and invalidates all entities.
         """
+        self._check_idle()
+        self._clear_data_caches()
+        self._clear_entity_cache()
         PY_AMPL_CALL(campl.AMPL_Reset(self._c_ampl))
 
     def close(self):
@@ -389,6 +549,9 @@ cdef class AMPL:
         execute optimization commands without restarting it will throw an
         exception.
         """
+        if self._param_shadows is not None:
+            self._clear_data_caches()
+        self._clear_entity_cache()
         if self._c_ampl is not NULL:
             PY_AMPL_CALL(campl.AMPL_Close(self._c_ampl))
             campl.AMPL_Free(&self._c_ampl);
@@ -402,7 +565,7 @@ cdef class AMPL:
         PY_AMPL_CALL(campl.AMPL_IsRunning(self._c_ampl, &isrunning))
         return isrunning
 
-    def solve(self, problem="", solver="", verbose=True, return_output=False, **kwargs):
+    def solve(self, problem="", solver="", verbose=True, return_output=False, timeout=None, **kwargs):
         """
         Solve the current model or the problem specified by ``problem``.
 
@@ -415,14 +578,27 @@ cdef class AMPL:
 
             return_output: Return output as a string if set to ``True``.
 
+            timeout: Maximum time in seconds to wait for the solve. When it
+            expires, the solve is interrupted (see
+            :func:`~amplpy.AMPL.interrupt`) and
+            :class:`~amplpy.SolveTimeoutError` is raised once the
+            interpreter is idle, with the solution found so far loaded.
+
             kwargs: Pass ``solvername_options`` as additional arguments.
 
         Raises:
-            RuntimeError: if the underlying interpreter is not running.
+            RuntimeError: if the underlying interpreter is not running, or
+            if it does not stop within ``INTERRUPT_TIMEOUT`` seconds once
+            the timeout expires.
+
+            SolveTimeoutError: if the timeout expires.
         """
+        self._check_idle()
         for option, value in kwargs.items():
             if option.endswith("_options"):
                 self.set_option(option, value)
+        if timeout is not None:
+            return self._solve_with_timeout(problem, solver, verbose, return_output, timeout)
         if not verbose or return_output:
             if solver != "":
                 self.set_option("solver", solver)
@@ -430,7 +606,175 @@ cdef class AMPL:
             if return_output:
                 return output
         else:
-            PY_AMPL_CALL(campl.AMPL_Solve(self._c_ampl, problem.encode('utf-8'), solver.encode('utf-8')))
+            problem_b = problem.encode('utf-8')
+            solver_b = solver.encode('utf-8')
+            self._solve(problem_b, solver_b)
+
+    cdef _solve(self, const char* problem, const char* solver):
+        self._check_idle()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        with nogil:
+            errorinfo = campl.AMPL_Solve(self._c_ampl, problem, solver)
+        PY_AMPL_CALL(errorinfo)
+
+    def _solve_with_timeout(self, problem, solver, verbose, return_output, timeout):
+        cdef _AsyncCall call
+        cdef _OutputCollector collector = None
+        if solver != "":
+            self.set_option("solver", solver)
+        previous_handler = self._output_handler
+        if not verbose or return_output:
+            collector = _OutputCollector()
+            self.set_output_handler(collector)
+        try:
+            call = _AsyncCall.create(self, f"solve {problem};\n", True)
+            Py_INCREF(call)
+            call.start(campl.AMPL_EvalAsync(self._c_ampl, call._argument, _async_call_done, <void*>call))
+            finished = call.wait(timeout)
+        finally:
+            if collector is not None:
+                self.set_output_handler(previous_handler)
+        output = collector.text() if return_output else None
+        if not finished:
+            # Errors reported by the interrupted solver are chained to the
+            # timeout instead of hiding it
+            try:
+                self._error_handler_wrapper.check()
+            except Exception as error:
+                raise SolveTimeoutError(
+                    f"The solve was interrupted after {timeout} seconds", output
+                ) from error
+            raise SolveTimeoutError(
+                f"The solve was interrupted after {timeout} seconds", output
+            )
+        self._error_handler_wrapper.check()
+        return output
+
+    def interrupt(self):
+        """
+        Interrupt the operation running in the interpreter, such as a solve
+        started with :func:`~amplpy.AMPL.solve_async`. The solver stops as
+        soon as possible and the solution found so far is loaded.
+
+        Cancelling the future returned by the asynchronous methods (e.g.,
+        with :func:`asyncio.wait_for`) interrupts the interpreter as well.
+        """
+        PY_AMPL_CALL(campl.AMPL_Interrupt(self._c_ampl))
+
+    def solve_async(self, problem="", solver="", **kwargs):
+        """
+        Start solving the current model or the problem specified by
+        ``problem`` without blocking, for use with :mod:`asyncio`.
+
+        The interpreter runs the solve in its own thread and resolves the
+        returned future when it finishes, so a single event loop can drive
+        many AMPL objects concurrently. Until the future is done, the methods
+        of this object that use the interpreter (including options and entity
+        reads and writes) raise ``RuntimeError``.
+
+        Args:
+            problem: Name of the problem or objective to solve.
+
+            solver: Name of the solver to use.
+
+            kwargs: Pass ``solvername_options`` as additional arguments.
+
+        Returns:
+            An :class:`asyncio.Future` that completes when the solve ends.
+
+        Raises:
+            RuntimeError: if there is no running event loop.
+        """
+        self._check_idle()
+        for option, value in kwargs.items():
+            if option.endswith("_options"):
+                self.set_option(option, value)
+        if solver != "":
+            self.set_option("solver", solver)
+        cdef _AsyncCall call
+        if problem != "":
+            call = _AsyncCall.create(self, f"solve {problem};\n")
+            Py_INCREF(call)
+            return call.start(campl.AMPL_EvalAsync(self._c_ampl, call._argument, _async_call_done, <void*>call))
+        call = _AsyncCall.create(self, None)
+        Py_INCREF(call)
+        return call.start(campl.AMPL_SolveAsync(self._c_ampl, _async_call_done, <void*>call))
+
+    def eval_async(self, statements):
+        """
+        Equivalent to :func:`~amplpy.AMPL.eval`, but without blocking: returns
+        an :class:`asyncio.Future` that completes when the interpreter has
+        evaluated the statements (see :func:`~amplpy.AMPL.solve_async`).
+
+        Args:
+            statements: A collection of AMPL statements and declarations to
+            be passed to the interpreter.
+
+        Raises:
+            RuntimeError: if there is no running event loop.
+        """
+        self._check_idle()
+        # Workaround for #56
+        if not statements.endswith((" ", ";", "\n")):
+            statements += "\n"
+        self._clear_data_caches()
+        self._clear_entity_cache()
+        cdef _AsyncCall call = _AsyncCall.create(self, statements)
+        Py_INCREF(call)
+        return call.start(campl.AMPL_EvalAsync(self._c_ampl, call._argument, _async_call_done, <void*>call))
+
+    def read_async(self, filename):
+        """
+        Equivalent to :func:`~amplpy.AMPL.read`, but without blocking: returns
+        an :class:`asyncio.Future` that completes when the file has been read
+        (see :func:`~amplpy.AMPL.solve_async`).
+
+        Args:
+            filename: Path to the file (Relative to the current working
+            directory or absolute).
+
+        Raises:
+            RuntimeError: if there is no running event loop.
+        """
+        self._check_idle()
+        self._clear_data_caches()
+        self._clear_entity_cache()
+        cdef _AsyncCall call = _AsyncCall.create(self, str(filename))
+        Py_INCREF(call)
+        return call.start(campl.AMPL_ReadAsync(self._c_ampl, call._argument, _async_call_done, <void*>call))
+
+    def read_data_async(self, filename):
+        """
+        Equivalent to :func:`~amplpy.AMPL.read_data`, but without blocking:
+        returns an :class:`asyncio.Future` that completes when the file has
+        been read (see :func:`~amplpy.AMPL.solve_async`).
+
+        Args:
+            filename: Path to the file (Relative to the current working
+            directory or absolute).
+
+        Raises:
+            RuntimeError: if there is no running event loop.
+        """
+        self._check_idle()
+        self._clear_data_caches()
+        self._clear_entity_cache()
+        cdef _AsyncCall call = _AsyncCall.create(self, str(filename))
+        Py_INCREF(call)
+        return call.start(campl.AMPL_ReadDataAsync(self._c_ampl, call._argument, _async_call_done, <void*>call))
+
+    def is_busy(self):
+        """
+        Check whether the interpreter is running an asynchronous operation.
+        While it is, the methods that use the interpreter (e.g.,
+        :func:`~amplpy.AMPL.eval`, options and entity reads and writes) raise
+        ``RuntimeError``.
+        """
+        cdef bool_c busy
+        if self._pending_call is not None:
+            return True
+        PY_AMPL_CALL(campl.AMPL_IsBusy(self._c_ampl, &busy))
+        return busy
 
     def cd(self, path=None):
         """
@@ -474,6 +818,7 @@ cdef class AMPL:
 
             TypeError: if the value has an invalid type.
         """
+        self._check_idle()
         if PyBool_Check(value):
             PY_AMPL_CALL(campl.AMPL_SetBoolOption(self._c_ampl, name.encode('utf-8'), value))
         elif isinstance(value, int):
@@ -499,6 +844,8 @@ cdef class AMPL:
         Raises:
             InvalidArgumet: if the option name is not valid.
         """
+        # Not checked against pending calls, since the error handler reads
+        # options while an asynchronous call reports its warnings
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef bool_c exists
         cdef char* value_c
@@ -531,7 +878,15 @@ cdef class AMPL:
         Raises:
             RuntimeError: in case the file does not exist.
         """
-        PY_AMPL_CALL(campl.AMPL_Read(self._c_ampl, str(filename).encode('utf-8')))
+        self._check_idle()
+        self._clear_data_caches()
+        self._clear_entity_cache()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef bytes filename_b = str(filename).encode('utf-8')
+        cdef const char* filename_c = filename_b
+        with nogil:
+            errorinfo = campl.AMPL_Read(self._c_ampl, filename_c)
+        PY_AMPL_CALL(errorinfo)
         self._error_handler_wrapper.check()
 
     def read_data(self, filename):
@@ -548,7 +903,15 @@ cdef class AMPL:
         Raises:
             RuntimeError: in case the file does not exist.
         """
-        PY_AMPL_CALL(campl.AMPL_ReadData(self._c_ampl, str(filename).encode('utf-8')))
+        self._check_idle()
+        self._clear_data_caches()
+        self._clear_entity_cache()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef bytes filename_b = str(filename).encode('utf-8')
+        cdef const char* filename_c = filename_b
+        with nogil:
+            errorinfo = campl.AMPL_ReadData(self._c_ampl, filename_c)
+        PY_AMPL_CALL(errorinfo)
         self._error_handler_wrapper.check()
 
     def get_value(self, scalar_expression):
@@ -566,6 +929,7 @@ cdef class AMPL:
         Raises:
             TypeError: in case scalar_expression does not evaluate to a value.
         """
+        self._check_idle()
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_VARIANT* v
         errorinfo = campl.AMPL_GetValue(self._c_ampl, scalar_expression.encode('utf-8'), &v)
@@ -591,11 +955,13 @@ cdef class AMPL:
         Raises:
             AMPLException: if the data assignment procedure was not successful.
         """
+        self._check_idle()
         if not isinstance(data, DataFrame):
             if pd is not None and isinstance(data, (pd.DataFrame, pd.Series)):
                 data = DataFrame.from_pandas(data)
         cdef DataFrame data_frame = data
         cdef campl.AMPL_DATAFRAME* data_c = data_frame.get_ptr()
+        self._clear_data_caches()
         if set_name is None:
             PY_AMPL_CALL(campl.AMPL_SetData(self._c_ampl, data_c, ""))
         else:
@@ -613,7 +979,14 @@ cdef class AMPL:
         Args:
             table_name: Name of the table to be read.
         """
-        PY_AMPL_CALL(campl.AMPL_ReadTable(self._c_ampl, table_name.encode('utf-8')))
+        self._check_idle()
+        self._clear_data_caches()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef bytes table_name_b = table_name.encode('utf-8')
+        cdef const char* table_name_c = table_name_b
+        with nogil:
+            errorinfo = campl.AMPL_ReadTable(self._c_ampl, table_name_c)
+        PY_AMPL_CALL(errorinfo)
 
     def write_table(self, table_name):
         """
@@ -627,7 +1000,13 @@ cdef class AMPL:
         Args:
             table_name: Name of the table to be written.
         """
-        PY_AMPL_CALL(campl.AMPL_WriteTable(self._c_ampl, table_name.encode('utf-8')))
+        self._check_idle()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef bytes table_name_b = table_name.encode('utf-8')
+        cdef const char* table_name_c = table_name_b
+        with nogil:
+            errorinfo = campl.AMPL_WriteTable(self._c_ampl, table_name_c)
+        PY_AMPL_CALL(errorinfo)
 
     def display(self, *ampl_expressions):
         """
@@ -785,128 +1164,37 @@ cdef class AMPL:
         """
         Get/Set a variable.
         """
-
-        class Variables(object):
-            def __init__(self, ampl):
-                self.ampl = ampl
-
-            def __getitem__(self, name):
-                return self.ampl.get_variable(name)
-
-            def __setitem__(self, name, value):
-                if isinstance(value, Real):
-                    self.ampl.get_variable(name).set_value(value)
-                else:
-                    self.ampl.get_variable(name).set_values(value)
-
-            def __iter__(self):
-                return self.ampl.get_variables()
-
-        return Variables(self)
+        return Variables.create(self)
 
     def _con(self):
         """
         Get/Set a constraint.
         """
-
-        class Constraints(object):
-            def __init__(self, ampl):
-                self.ampl = ampl
-
-            def __getitem__(self, name):
-                return self.ampl.get_constraint(name)
-
-            def __setitem__(self, name, value):
-                if isinstance(value, Real):
-                    self.ampl.get_constraint(name).set_dual(value)
-                else:
-                    self.ampl.get_constraint(name).set_values(value)
-
-            def __iter__(self):
-                return self.ampl.get_constraints()
-
-        return Constraints(self)
+        return Constraints.create(self)
 
     def _obj(self):
         """
         Get an objective.
         """
-
-        class Objectives(object):
-            def __init__(self, ampl):
-                self.ampl = ampl
-
-            def __getitem__(self, name):
-                return self.ampl.get_objective(name)
-
-            def __iter__(self):
-                return self.ampl.get_objectives()
-
-        return Objectives(self)
+        return Objectives.create(self)
 
     def _set(self):
         """
         Get/Set a set.
         """
-
-        class Sets(object):
-            def __init__(self, ampl):
-                self.ampl = ampl
-
-            def __getitem__(self, name):
-                return self.ampl.get_set(name)
-
-            def __setitem__(self, name, values):
-                self.ampl.get_set(name).set_values(values)
-
-            def __iter__(self):
-                return self.ampl.get_sets()
-
-        return Sets(self)
+        return Sets.create(self)
 
     def _param(self):
         """
         Get/Set a parameter.
         """
-
-        class Parameters(object):
-            def __init__(self, ampl):
-                self.ampl = ampl
-
-            def __getitem__(self, name):
-                return self.ampl.get_parameter(name)
-
-            def __setitem__(self, name, value):
-                if isinstance(value, (Real, str)):
-                    self.ampl.get_parameter(name).set(value)
-                else:
-                    self.ampl.get_parameter(name).set_values(value)
-
-            def __iter__(self):
-                return self.ampl.get_parameters()
-
-        return Parameters(self)
+        return Parameters.create(self)
 
     def _option(self):
         """
         Get/Set an option.
         """
-
-        class Options(object):
-            def __init__(self, ampl):
-                self.ampl = ampl
-
-            def __getitem__(self, name):
-                return self.ampl.get_option(name)
-
-            def __setitem__(self, name, value):
-                if isinstance(value, dict):
-                    if name.endswith("_options"):
-                        self.ampl.set_option(name, " ".join(f"{k}={int(v) if isinstance(v, builtins.bool) else v}" for k, v in value.items()))
-                else:
-                    self.ampl.set_option(name, value)
-
-        return Options(self)
+        return Options.create(self)
 
     def _set_option(self, options_dict):
         for name, value in options_dict.items():
@@ -1263,8 +1551,12 @@ cdef class AMPL:
     _loadSession = _load_session
     _startRecording = _start_recording
     _stopRecording = _stop_recording
+    enableEntityCache = enable_entity_cache
+    entityCacheInfo = entity_cache_info
+    evalAsync = eval_async
     exportData = export_data
     exportModel = export_model
+    fromTemplate = from_template
     getConstraint = get_constraint
     getConstraints = get_constraints
     getCurrentObjective = get_current_objective
@@ -1284,12 +1576,16 @@ cdef class AMPL:
     getValue = get_value
     getVariable = get_variable
     getVariables = get_variables
+    isBusy = is_busy
     isRunning = is_running
+    readAsync = read_async
     readData = read_data
+    readDataAsync = read_data_async
     readTable = read_table
     setData = set_data
     setErrorHandler = set_error_handler
     setOption = set_option
     setOutputHandler = set_output_handler
+    solveAsync = solve_async
     toString = to_string
     writeTable = write_table
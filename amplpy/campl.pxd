@@ -4,6 +4,7 @@
 # add except * to the end of ctypedef void (*ErrorHandlerCbPtr)(bool isWarning, const char* filename, int row, int offset, const char* message, void* errorHandler) except *
 # add except * to the end of ctypedef void (*AMPL_OutputHandlerCb)(AMPL_OUTPUTKIND, const char*, void*) except *
 # add except * to the end of AMPL_Eval(AMPL* ampl, const char* statement) except *
+# add nogil to the end of the long-running calls: AMPL_Eval, AMPL_Solve, AMPL_Read, AMPL_ReadData, AMPL_GetData, AMPL_ReadTable, AMPL_WriteTable, AMPL_GetOutput
 
 from libcpp cimport bool # add this line
 
@@ -352,7 +353,7 @@ cdef extern from "ampl/ampl_c.h":
 
     void AMPL_Free(AMPL** ampl)
 
-    AMPL_ERRORINFO* AMPL_Eval(AMPL* ampl, const char* statement) except *
+    AMPL_ERRORINFO* AMPL_Eval(AMPL* ampl, const char* statement) except * nogil
 
     AMPL_ERRORINFO* AMPL_EvalAsync(AMPL* ampl, const char* statement, RunnablePtr function, void* cb)
 
@@ -370,7 +371,7 @@ cdef extern from "ampl/ampl_c.h":
 
     AMPL_ERRORINFO* AMPL_IsBusy(AMPL* ampl, bool* busy)
 
-    AMPL_ERRORINFO* AMPL_Solve(AMPL* ampl, const char* problem, const char* solver)
+    AMPL_ERRORINFO* AMPL_Solve(AMPL* ampl, const char* problem, const char* solver) nogil
 
     AMPL_ERRORINFO* AMPL_Interrupt(AMPL* ampl)
 
@@ -402,19 +403,19 @@ cdef extern from "ampl/ampl_c.h":
 
     AMPL_ERRORINFO* AMPL_SetBoolOption(AMPL* ampl, const char* name, bool value)
 
-    AMPL_ERRORINFO* AMPL_Read(AMPL* ampl, const char* fileName)
+    AMPL_ERRORINFO* AMPL_Read(AMPL* ampl, const char* fileName) nogil
 
-    AMPL_ERRORINFO* AMPL_ReadData(AMPL* ampl, const char* fileName)
+    AMPL_ERRORINFO* AMPL_ReadData(AMPL* ampl, const char* fileName) nogil
 
-    AMPL_ERRORINFO* AMPL_GetData(AMPL* ampl, const char* const* displayStatements, size_t n, AMPL_DATAFRAME** output)
+    AMPL_ERRORINFO* AMPL_GetData(AMPL* ampl, const char* const* displayStatements, size_t n, AMPL_DATAFRAME** output) nogil
 
     AMPL_ERRORINFO* AMPL_SetData(AMPL* ampl, AMPL_DATAFRAME* df, const char* setName)
 
     AMPL_ERRORINFO* AMPL_ToString(AMPL* ampl, char** output)
 
-    AMPL_ERRORINFO* AMPL_ReadTable(AMPL* ampl, const char* tableName)
+    AMPL_ERRORINFO* AMPL_ReadTable(AMPL* ampl, const char* tableName) nogil
 
-    AMPL_ERRORINFO* AMPL_WriteTable(AMPL* ampl, const char* tableName)
+    AMPL_ERRORINFO* AMPL_WriteTable(AMPL* ampl, const char* tableName) nogil
 
     AMPL_ERRORINFO* AMPL_Write(AMPL* ampl, const char* filename, const char* auxfiles)
 
@@ -424,7 +425,7 @@ cdef extern from "ampl/ampl_c.h":
 
     AMPL_ERRORINFO* AMPL_GetValueNumeric(AMPL* ampl, const char* scalarExpression, double* value)
 
-    AMPL_ERRORINFO* AMPL_GetOutput(AMPL* ampl, const char* amplstatement, char** output)
+    AMPL_ERRORINFO* AMPL_GetOutput(AMPL* ampl, const char* amplstatement, char** output) nogil
 
     AMPL_ERRORINFO* AMPL_CallVisualisationCommandOnNames(AMPL* ampl, const char* command, const char* const* args, size_t nargs)
 
@@ -33,7 +33,6 @@ cdef class Constraint(Entity):
     cdef create(AMPL ampl, char* name, campl.AMPL_TUPLE* index, parent):
         entity = Constraint()
         entity._ampl = ampl
-        Py_INCREF(entity._ampl)
         entity._name = name
         entity._index = index
         entity.wrap_function = campl.AMPL_CONSTRAINT
@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
-from libc.stdlib cimport malloc, free
-from libc.string cimport strdup
+from libc.stdlib cimport malloc, calloc, free
+from libc.string cimport strdup, strlen, memcpy
+from libc.math cimport NAN
+from libc.stdint cimport int64_t, uint8_t
 
-from cpython.float cimport PyFloat_AsDouble
+from cpython.float cimport PyFloat_AsDouble, PyFloat_Check
+from cpython.unicode cimport PyUnicode_Check
 from cpython.long cimport PyLong_AsLong, PyLong_Check
 from cpython.exc cimport PyErr_Occurred, PyErr_Clear
 
+import itertools
 from numbers import Real
 
 try:
@@ -16,19 +20,200 @@ try:
     import numpy as np
 except ImportError:
     np = None
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+cdef _column_to_numpy(campl.AMPL_DATAFRAME* df, size_t colindex, size_t start, size_t stop):
+    """
+    Copy the rows ``start`` to ``stop`` of a column into a numpy array.
+    Numeric columns are written straight into a float64 buffer (empty cells
+    become ``nan``); as soon as a string is found the column is decoded
+    into an object array instead.
+    """
+    cdef campl.AMPL_ERRORINFO* errorinfo
+    cdef campl.AMPL_VARIANT* v
+    cdef campl.AMPL_TYPE vtype
+    cdef double value
+    cdef size_t i
+    cdef size_t size = stop - start
+    cdef double[::1] buffer
+    values = np.empty(size, dtype=np.float64)
+    buffer = values
+    for i in range(size):
+        errorinfo = campl.AMPL_DataFrameElement(df, start + i, colindex, &v)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+        campl.AMPL_VariantGetType(v, &vtype)
+        if vtype == campl.AMPL_NUMERIC:
+            campl.AMPL_VariantGetNumericValue(v, &value)
+            buffer[i] = value
+        elif vtype == campl.AMPL_EMPTY:
+            buffer[i] = NAN
+        else:
+            values = np.empty(size, dtype=object)
+            for i in range(size):
+                errorinfo = campl.AMPL_DataFrameElement(df, start + i, colindex, &v)
+                if errorinfo:
+                    PY_AMPL_CALL(errorinfo)
+                values[i] = to_py_variant(v)
+            break
+    return values
+
+
+cdef list _column_to_list(campl.AMPL_DATAFRAME* df, size_t colindex, size_t start, size_t stop):
+    """
+    Decode the rows ``start`` to ``stop`` of a column into a list of Python
+    values.
+    """
+    cdef campl.AMPL_ERRORINFO* errorinfo
+    cdef campl.AMPL_VARIANT* v
+    cdef size_t i
+    cdef list values = []
+    for i in range(start, stop):
+        errorinfo = campl.AMPL_DataFrameElement(df, i, colindex, &v)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+        values.append(to_py_variant(v))
+    return values
+
+
+cdef _column_to_arrow(campl.AMPL_DATAFRAME* df, size_t colindex, size_t start, size_t stop):
+    """
+    Copy the rows ``start`` to ``stop`` of a column into a pyarrow array.
+    Numeric columns are written into a float64 buffer and string columns
+    into offset and data buffers; empty cells become nulls.
+    """
+    cdef campl.AMPL_ERRORINFO* errorinfo
+    cdef campl.AMPL_VARIANT* v
+    cdef campl.AMPL_TYPE vtype
+    cdef double value
+    cdef char* value_c
+    cdef size_t i, length
+    cdef size_t size = stop - start
+    cdef int64_t total = 0
+    cdef size_t null_count = 0
+    cdef bint has_numbers = False
+    cdef bint has_strings = False
+    cdef double[::1] numbers
+    cdef uint8_t[::1] valid
+    cdef int64_t[::1] offsets
+    cdef uint8_t[::1] data
+    numbers_array = np.zeros(size, dtype=np.float64)
+    valid_array = np.ones(size, dtype=np.uint8)
+    offsets_array = np.zeros(size + 1, dtype=np.int64)
+    numbers = numbers_array
+    valid = valid_array
+    offsets = offsets_array
+    for i in range(size):
+        errorinfo = campl.AMPL_DataFrameElement(df, start + i, colindex, &v)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+        campl.AMPL_VariantGetType(v, &vtype)
+        if vtype == campl.AMPL_NUMERIC:
+            campl.AMPL_VariantGetNumericValue(v, &value)
+            numbers[i] = value
+            has_numbers = True
+        elif vtype == campl.AMPL_STRING:
+            campl.AMPL_VariantGetStringValue(v, &value_c)
+            total += strlen(value_c)
+            has_strings = True
+        else:
+            valid[i] = 0
+            null_count += 1
+        offsets[i + 1] = total
+    if has_numbers and has_strings:
+        raise ValueError(
+            "Columns with both numbers and strings cannot be converted to Arrow"
+        )
+    validity = None
+    if null_count > 0:
+        validity = pa.py_buffer(np.packbits(valid_array, bitorder="little"))
+    if not has_strings:
+        return pa.Array.from_buffers(
+            pa.float64(), size, [validity, pa.py_buffer(numbers_array)], null_count
+        )
+    data_array = np.empty(max(total, 1), dtype=np.uint8)
+    data = data_array
+    for i in range(size):
+        if valid[i]:
+            campl.AMPL_DataFrameElement(df, start + i, colindex, &v)
+            campl.AMPL_VariantGetStringValue(v, &value_c)
+            length = offsets[i + 1] - offsets[i]
+            if length > 0:
+                memcpy(&data[offsets[i]], value_c, length)
+    return pa.Array.from_buffers(
+        pa.large_string(),
+        size,
+        [validity, pa.py_buffer(offsets_array), pa.py_buffer(data_array)],
+        null_count,
+    )
+
+
+def _index_key(key):
+    """
+    Normalize a key to the form used in the index of a DataFrame: a single
+    value for one indexing column and a tuple otherwise.
+    """
+    if isinstance(key, list):
+        key = tuple(key)
+    if isinstance(key, tuple) and len(key) == 1:
+        return key[0]
+    return key
+
+
+def _axis_codes(column):
+    """
+    Get the distinct labels of an index column in order of first appearance
+    and the position of each row along that axis.
+    """
+    try:
+        labels, first, codes = np.unique(
+            column, return_index=True, return_inverse=True
+        )
+    except TypeError:
+        # Mixed numbers and strings cannot be sorted
+        positions = {}
+        codes = np.fromiter(
+            (positions.setdefault(label, len(positions)) for label in column.tolist()),
+            dtype=np.intp,
+            count=len(column),
+        )
+        return np.array(list(positions), dtype=object), codes
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return labels[order], rank[codes.ravel()]
+
+
+def _pandas_values(values):
+    """
+    Get the values of a pandas Series or Index as a numeric numpy array
+    if possible, or as a list otherwise.
+    """
+    array = values.to_numpy()
+    if array.dtype.kind in "biuf":
+        return array
+    return array.tolist()
 
 
 cdef class Row(object):
     """
     Represents a row in a :class:`~amplpy.DataFrame`.
     """
-    cdef campl.AMPL_DATAFRAME* _df
+    cdef DataFrame _frame
     cdef size_t _index
 
     @staticmethod
-    cdef create(campl.AMPL_DATAFRAME* df, size_t index):
+    cdef create(DataFrame frame, size_t index):
         row = Row()
-        row._df = df
+        row._frame = frame
         row._index = index
         return row
 
@@ -36,11 +221,11 @@ cdef class Row(object):
         return self.to_string()
 
     def __iter__(self):
-        return RowIterator.create(self._df, self._index)
+        return RowIterator.create(self._frame._c_df, self._index)
 
     def __getitem__(self, key):
         cdef campl.AMPL_VARIANT* v
-        PY_AMPL_CALL(campl.AMPL_DataFrameElement(self._df, self._index, key, &v))
+        PY_AMPL_CALL(campl.AMPL_DataFrameElement(self._frame._c_df, self._index, key, &v))
         return to_py_variant(v)
 
     def to_string(self):
@@ -54,13 +239,13 @@ cdef class Column(object):
     """
     Represents a column in a :class:`~amplpy.DataFrame`.
     """
-    cdef campl.AMPL_DATAFRAME* _df
+    cdef DataFrame _frame
     cdef size_t _index
 
     @staticmethod
-    cdef create(campl.AMPL_DATAFRAME* df, size_t index):
+    cdef create(DataFrame frame, size_t index):
         col = Column()
-        col._df = df
+        col._frame = frame
         col._index = index
         return col
 
@@ -68,7 +253,7 @@ cdef class Column(object):
         return self.to_string()
 
     def __iter__(self):
-        return ColIterator.create(self._df, self._index)
+        return ColIterator.create(self._frame._c_df, self._index)
 
     def to_string(self):
         return str(self.to_list())
@@ -78,15 +263,30 @@ cdef class Column(object):
         cdef campl.AMPL_VARIANT* v
         cdef size_t rowindex
         cdef size_t i
-        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._df, &rowindex))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._frame._c_df, &rowindex))
         for i in range(rowindex):
-            PY_AMPL_CALL(campl.AMPL_DataFrameElement(self._df, i, self._index, &v))
+            PY_AMPL_CALL(campl.AMPL_DataFrameElement(self._frame._c_df, i, self._index, &v))
             py_list.append(to_py_variant(v))
         return py_list
 
+    def to_numpy(self):
+        """
+        Return a numpy array with the values of the column, without
+        creating intermediate Python objects for numeric columns.
+
+        Returns:
+            A float64 array (empty cells are ``nan``) for numeric columns,
+            or an object array if the column contains strings.
+        """
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        cdef size_t size
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._frame._c_df, &size))
+        return _column_to_numpy(self._frame._c_df, self._index, 0, size)
+
     # Aliases
     toString = to_string
     toList = to_list
+    toNumpy = to_numpy
 
 
 cdef class DataFrame(object):
@@ -114,14 +314,21 @@ cdef class DataFrame(object):
     - From Pandas dataframes with :func:`~amplpy.DataFrame.from_pandas`
     - From Numpy matrices with :func:`~amplpy.DataFrame.from_numpy`
     - From Python dictionaries with :func:`~amplpy.DataFrame.from_dict`
+    - From Arrow tables with :func:`~amplpy.DataFrame.from_arrow`
+    - From Polars dataframes with :func:`~amplpy.DataFrame.from_polars`
 
     and can be converted to various object types:
 
     - Pandas dataframes with :func:`~amplpy.DataFrame.to_pandas`
     - Python dictionary with :func:`~amplpy.DataFrame.to_dict`
     - Python list with :func:`~amplpy.DataFrame.to_list`
+    - Numpy arrays with :func:`~amplpy.DataFrame.to_numpy`
+    - Arrow tables with :func:`~amplpy.DataFrame.to_arrow`
+    - Polars dataframes with :func:`~amplpy.DataFrame.to_polars`
     """
     cdef campl.AMPL_DATAFRAME* _c_df
+    cdef object _row_index
+    cdef object _row_values
 
     def __cinit__(self, index, columns=tuple(), **kwargs):
         """
@@ -242,6 +449,7 @@ cdef class DataFrame(object):
            for the row to be added, or multiple arguments with the values for
            each column.
         """
+        self._clear_index()
         cdef campl.AMPL_ERRORINFO* errorinfo
         if len(value) == 1 and isinstance(value[0], (tuple, list)):
             value = value[0]
@@ -252,6 +460,86 @@ cdef class DataFrame(object):
         if errorinfo:
             PY_AMPL_CALL(errorinfo)
 
+    def add_rows(self, rows, batch_size=65536):
+        """
+        Add multiple rows to the DataFrame. The size of each row must be
+        equal to the total number of columns in the dataframe.
+
+        Rows are consumed in batches of ``batch_size``, and each batch is
+        converted to typed column chunks (float64 arrays for numeric values)
+        before the next one is read. Each column is then written once with
+        all the new values. If the dataframe already has rows, its cells are
+        copied once into a new dataframe with room for all of them, which
+        avoids adding the rows one by one. Existing rows keep their positions,
+        so earlier row and column views remain valid.
+
+        Args:
+            rows: An iterable of tuples or lists with the values for each
+            column (single values are accepted if there is only one column).
+
+            batch_size: Number of rows to convert at a time.
+
+        Raises:
+            ValueError: If a row does not have one value per column, or if
+            its index is already present. No rows are added in that case.
+        """
+        self._clear_index()
+        cdef DataFrame target
+        cdef size_t nrows, ncols, nindices, size, i, j
+        assert batch_size > 0
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumCols(self._c_df, &ncols))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(self._c_df, &nindices))
+        chunks = [[] for j in range(ncols)]
+        size = 0
+        rows = iter(rows)
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                break
+            for i in range(len(batch)):
+                if not isinstance(batch[i], (tuple, list)):
+                    batch[i] = (batch[i],)
+                if <size_t>len(batch[i]) != ncols:
+                    raise ValueError(
+                        f"Expected {ncols} values per row, got {len(batch[i])}"
+                    )
+            size += len(batch)
+            for j, column in enumerate(zip(*batch)):
+                if np is not None and _column_kind(column) == KIND_NUMERIC:
+                    column = np.array(column, dtype=np.float64)
+                chunks[j].append(column)
+        if size == 0 or ncols == 0:
+            return
+        columns = []
+        for column in chunks:
+            if np is not None and all(isinstance(chunk, np.ndarray) for chunk in column):
+                columns.append(np.concatenate(column))
+            else:
+                columns.append(list(itertools.chain.from_iterable(column)))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+        if nindices > 0:
+            keys = set()
+            indices = [self._get_column_values(j, nrows) for j in range(nindices)]
+            for j in range(nindices):
+                indices[j].extend(columns[j])
+            for key in zip(*indices):
+                if key in keys:
+                    raise ValueError(
+                        f"Element with this index already present: {_index_key(key)!r}"
+                    )
+                keys.add(key)
+        headers = self._get_headers()
+        if nrows == 0:
+            for j in range(ncols):
+                self._set_column(headers[j], columns[j])
+            return
+        target = DataFrame(index=headers[:nindices], columns=headers[nindices:])
+        target._resize(nrows + size)
+        for j in range(ncols):
+            target._copy_cells(self, j, nrows)
+            target._set_cells(j, columns[j], nrows)
+        self._c_df, target._c_df = target._c_df, self._c_df
+
     def _add_column(self, header, values=None):
         """
         Add a new column with the corresponding header and values to the
@@ -263,40 +551,38 @@ cdef class DataFrame(object):
             values: A list of size :func:`~amplpy.DataFrame.getNumRows` with
             all the values of the new column.
         """   
+        self._clear_index()
         cdef campl.AMPL_ERRORINFO* errorinfo
-        cdef size_t size = len(values)
-        cdef const char** c_string_array = NULL
-        cdef double* c_double_array = NULL
+        cdef _ArgsBuffer args
+        cdef const double[::1] buffer
+        cdef size_t colindex
         if values is None:
             values = []
+        cdef size_t size = len(values)
         if size == 0:
             PY_AMPL_CALL(campl.AMPL_DataFrameAddEmptyColumn(self._c_df, header.encode('utf-8')))
-        else:
-            assert len(values) == self._get_num_rows()
-            if any(isinstance(value, str) for value in values):
-                c_string_array = <const char**> malloc(size * sizeof(const char*))
-                if not isinstance(values, (list, tuple)):
-                    values = list(values)
-                for i in range(size):
-                    c_string_array[i] = strdup(values[i].encode('utf-8'))
-                errorinfo = campl.AMPL_DataFrameAddColumnString(self._c_df, header.encode('utf-8'), c_string_array)
-                for i in range(size):
-                    if c_string_array[i] != NULL:
-                        free(c_string_array[i])
-                free(c_string_array)
+            return
+        assert len(values) == self._get_num_rows()
+        if np is not None and isinstance(values, np.ndarray):
+            if values.dtype.kind in "biuf":
+                buffer = np.ascontiguousarray(values, dtype=np.float64)
+                errorinfo = campl.AMPL_DataFrameAddColumnDouble(self._c_df, header.encode('utf-8'), &buffer[0])
                 if errorinfo:
                     PY_AMPL_CALL(errorinfo)
-            elif all(isinstance(value, Real) for value in values):
-                values = list(map(float, values))
-                c_double_array = <double*> malloc(size * sizeof(double))
-                for i in range(size):
-                    c_double_array[i] = values[i]
-                errorinfo = campl.AMPL_DataFrameAddColumnDouble(self._c_df, header.encode('utf-8'), c_double_array)
-                free(c_double_array)
-                if errorinfo:
-                    PY_AMPL_CALL(errorinfo)
-            else:
-                raise NotImplementedError
+                return
+            values = values.tolist()
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        kind = _column_kind(values)
+        if kind == KIND_MIXED:
+            PY_AMPL_CALL(campl.AMPL_DataFrameAddEmptyColumn(self._c_df, header.encode('utf-8')))
+            PY_AMPL_CALL(campl.AMPL_DataFrameGetColumnIndex(self._c_df, header.encode('utf-8'), &colindex))
+            self._set_cells(colindex, values)
+        else:
+            args = _ArgsBuffer(values, kind)
+            errorinfo = campl.AMPL_DataFrameAddColumn(self._c_df, header.encode('utf-8'), args._c_args)
+            if errorinfo:
+                PY_AMPL_CALL(errorinfo)
 
     def _get_column(self, header):
         """
@@ -307,7 +593,7 @@ cdef class DataFrame(object):
         """
         cdef size_t index
         PY_AMPL_CALL(campl.AMPL_DataFrameGetColumnIndex(self._c_df, header.encode('utf-8'), &index))
-        return Column.create(self._c_df, index)
+        return Column.create(self, index)
 
     def _set_column(self, header, values):
         """
@@ -318,11 +604,32 @@ cdef class DataFrame(object):
 
             values: The values to set.
         """
+        self._clear_index()
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef double* c_double_array = NULL
         cdef char** c_string_array = NULL
         cdef size_t size = len(values)
-        if isinstance(values[0], str):
+        cdef size_t nrows, colindex
+        if np is not None and isinstance(values, np.ndarray):
+            if values.dtype.kind in "biuf":
+                self._set_column_array(header, values)
+                return
+            values = values.tolist()
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        kind = _column_kind(values)
+        if kind == KIND_MIXED:
+            PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+            if nrows == 0:
+                # Create the rows with placeholder values
+                c_double_array = <double*> calloc(max(size, 1), sizeof(double))
+                errorinfo = campl.AMPL_DataFrameSetColumnArgDouble(self._c_df, header.encode('utf-8'), c_double_array, size)
+                free(c_double_array)
+                if errorinfo:
+                    PY_AMPL_CALL(errorinfo)
+            PY_AMPL_CALL(campl.AMPL_DataFrameGetColumnIndex(self._c_df, header.encode('utf-8'), &colindex))
+            self._set_cells(colindex, values)
+        elif kind == KIND_STRING:
             c_string_array = <char**> malloc(size * sizeof(char*))
             for i in range(size):
                 c_string_array[i] = strdup(values[i].encode('utf-8'))
@@ -348,6 +655,150 @@ cdef class DataFrame(object):
             if errorinfo:
                 PY_AMPL_CALL(errorinfo)
 
+    cdef _set_cells(self, size_t colindex, values, size_t start=0):
+        """
+        Set the values of a column one cell at a time, from row ``start``
+        on, for columns mixing numbers, strings and empty values.
+        """
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef campl.AMPL_VARIANT* variant
+        cdef size_t i
+        for i in range(len(values)):
+            variant = to_c_variant(values[i])
+            errorinfo = campl.AMPL_DataFrameSetValueByIndex(self._c_df, start + i, colindex, variant)
+            campl.AMPL_VariantFree(&variant)
+            if errorinfo:
+                PY_AMPL_CALL(errorinfo)
+
+    cdef _resize(self, size_t size):
+        """
+        Create ``size`` rows in an empty dataframe, with placeholder values
+        to be replaced with :func:`_set_cells`.
+        """
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef double* c_double_array = <double*> calloc(max(size, 1), sizeof(double))
+        header = self._get_headers()[0]
+        errorinfo = campl.AMPL_DataFrameSetColumnArgDouble(self._c_df, header.encode('utf-8'), c_double_array, size)
+        free(c_double_array)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+
+    cdef _copy_cells(self, DataFrame source, size_t colindex, size_t size):
+        """
+        Copy the first ``size`` cells of a column of another dataframe
+        without converting them to Python objects.
+        """
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef campl.AMPL_VARIANT* variant
+        cdef size_t i
+        for i in range(size):
+            errorinfo = campl.AMPL_DataFrameElement(source._c_df, i, colindex, &variant)
+            if errorinfo:
+                PY_AMPL_CALL(errorinfo)
+            errorinfo = campl.AMPL_DataFrameSetValueByIndex(self._c_df, i, colindex, variant)
+            if errorinfo:
+                PY_AMPL_CALL(errorinfo)
+
+    cdef _set_column_array(self, header, values):
+        """
+        Set the values of a column from a numeric numpy array, passing its
+        buffer directly to AMPL (a copy is only made if the array is not
+        contiguous or not of type float64).
+        """
+        self._clear_index()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef const double[::1] buffer = np.ascontiguousarray(values, dtype=np.float64)
+        cdef size_t size = buffer.shape[0]
+        cdef const double* c_double_array = NULL
+        if size > 0:
+            c_double_array = &buffer[0]
+        errorinfo = campl.AMPL_DataFrameSetColumnArgDouble(self._c_df, header.encode('utf-8'), c_double_array, size)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+
+    cdef _set_column_arrow(self, header, array):
+        """
+        Set the values of a column from a pyarrow array. Numeric arrays are
+        passed as float64 buffers and string arrays (plain or
+        dictionary-encoded) are read from their buffers without creating
+        Python strings.
+        """
+        self._clear_index()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef size_t i, j, k, size, nstrings
+        cdef const int64_t[::1] offsets
+        cdef const int64_t[::1] codes
+        cdef const uint8_t[::1] data
+        cdef char* block = NULL
+        cdef char** strings = NULL
+        cdef const char** c_string_array = NULL
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks()
+        size = len(array)
+        if size == 0:
+            return
+        kind = array.type
+        if pa.types.is_dictionary(kind):
+            dictionary = array.dictionary
+            codes_array = array.indices
+            kind = dictionary.type
+        else:
+            dictionary = array
+            codes_array = None
+        if not (pa.types.is_string(kind) or pa.types.is_large_string(kind)):
+            if (
+                pa.types.is_integer(kind)
+                or pa.types.is_floating(kind)
+                or pa.types.is_boolean(kind)
+            ):
+                self._set_column_array(
+                    header, array.to_numpy(zero_copy_only=False).astype(np.float64)
+                )
+            else:
+                self._set_column(header, array.to_pylist())
+            return
+        if array.null_count > 0 or dictionary.null_count > 0:
+            raise ValueError("Null values in string columns are not supported")
+        nstrings = len(dictionary)
+        buffers = dictionary.buffers()
+        offset_type = np.int64 if pa.types.is_large_string(kind) else np.int32
+        offsets = np.frombuffer(buffers[1], dtype=offset_type)[
+            dictionary.offset : dictionary.offset + nstrings + 1
+        ].astype(np.int64)
+        if buffers[2] is None or offsets[nstrings] == 0:
+            data = np.zeros(1, dtype=np.uint8)
+        else:
+            data = np.frombuffer(buffers[2], dtype=np.uint8)
+        # Copy the strings into a single block adding the null terminators
+        block = <char*> malloc(offsets[nstrings] - offsets[0] + nstrings)
+        strings = <char**> malloc(nstrings * sizeof(char*))
+        c_string_array = <const char**> malloc(size * sizeof(char*))
+        try:
+            k = 0
+            for i in range(nstrings):
+                strings[i] = &block[k]
+                if offsets[i + 1] > offsets[i]:
+                    memcpy(&block[k], &data[offsets[i]], offsets[i + 1] - offsets[i])
+                k += offsets[i + 1] - offsets[i]
+                block[k] = 0
+                k += 1
+            if codes_array is None:
+                for i in range(size):
+                    c_string_array[i] = strings[i]
+            else:
+                codes = codes_array.to_numpy(zero_copy_only=False).astype(np.int64)
+                for i in range(size):
+                    c_string_array[i] = strings[codes[i]]
+            errorinfo = campl.AMPL_DataFrameSetColumnArgString(
+                self._c_df, header.encode('utf-8'), c_string_array, size
+            )
+            if errorinfo:
+                PY_AMPL_CALL(errorinfo)
+        finally:
+            free(c_string_array)
+            free(strings)
+            free(block)
+
     def _get_row(self, key):
         """
         Get a row by value of the indexing columns. If the index is not
@@ -361,12 +812,84 @@ cdef class DataFrame(object):
         """
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef size_t index
+        if self._row_index is not None:
+            try:
+                return Row.create(self, self._row_index[_index_key(key)])
+            except KeyError:
+                raise KeyError(key) from None
         cdef campl.AMPL_TUPLE* tuple = to_c_tuple(key)
         errorinfo = campl.AMPL_DataFrameGetRowIndex(self._c_df, tuple, &index)
         campl.AMPL_TupleFree(&tuple)
         if errorinfo:
             PY_AMPL_CALL(errorinfo)
-        return Row.create(self._c_df, index)
+        return Row.create(self, index)
+
+    cdef _clear_index(self):
+        self._row_index = None
+        self._row_values = None
+
+    def build_index(self):
+        """
+        Build a hash index from the values of the indexing columns to the
+        row positions, speeding up :func:`~amplpy.DataFrame.get_rows` and
+        row lookups by key. The index is discarded when the dataframe is
+        modified.
+        """
+        cdef size_t nrows, ncols, nindices, j
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumCols(self._c_df, &ncols))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(self._c_df, &nindices))
+        if nindices == 0:
+            keys = [()] if nrows > 0 else []
+        else:
+            columns = [self._get_column_values(j, nrows) for j in range(nindices)]
+            keys = columns[0] if nindices == 1 else zip(*columns)
+        self._row_index = {key: i for i, key in enumerate(keys)}
+        self._row_values = None
+        if np is not None:
+            self._row_values = [
+                _column_to_numpy(self._c_df, j, 0, nrows) for j in range(nindices, ncols)
+            ]
+
+    def get_rows(self, keys):
+        """
+        Get the values of the rows with the specified keys, in the order of
+        the keys. Builds the index (see :func:`~amplpy.DataFrame.build_index`)
+        if needed.
+
+        Args:
+            keys: Iterable with the values of the indexing columns for each
+            row.
+
+        Returns:
+            A two-dimensional numpy array with one row per key and one column
+            per data column (float64 if all of them are numeric), or a list
+            of tuples if numpy is not available.
+
+        Raises:
+            KeyError: If one of the keys is not found.
+        """
+        if self._row_index is None:
+            self.build_index()
+        row_index = self._row_index
+        try:
+            positions = [row_index[_index_key(key)] for key in keys]
+        except KeyError as e:
+            raise KeyError(e.args[0]) from None
+        if self._row_values is None:
+            rows = [list(Row.create(self, i)) for i in positions]
+            nindices = self._get_num_indices()
+            return [tuple(row[nindices:]) for row in rows]
+        positions = np.array(positions, dtype=np.intp)
+        columns = [column[positions] for column in self._row_values]
+        if len(columns) == 0:
+            return np.empty((len(positions), 0), dtype=np.float64)
+        return np.column_stack(columns)
+
+    def _get_column_values(self, size_t colindex, size_t nrows):
+        if np is not None:
+            return _column_to_numpy(self._c_df, colindex, 0, nrows).tolist()
+        return Column.create(self, colindex).to_list()
 
     def _get_row_by_index(self, index):
         """
@@ -378,7 +901,7 @@ cdef class DataFrame(object):
         Returns:
             The corresponding row.
         """
-        return Row.create(self._c_df, index)
+        return Row.create(self, index)
 
     def _get_headers(self):
         """
@@ -417,12 +940,15 @@ cdef class DataFrame(object):
             else:
                 return [value]
 
-        for key, value in values.items():
-            key = conv_to_list(key)
-            assert len(key) == nindices
-            value = conv_to_list(value)
-            assert len(value) == ncols - nindices
-            self._add_row(key + value)
+        def to_rows():
+            for key, value in values.items():
+                key = conv_to_list(key)
+                assert len(key) == nindices
+                value = conv_to_list(value)
+                assert len(value) == ncols - nindices
+                yield key + value
+
+        self.add_rows(to_rows())
 
     def to_dict(self):
         """
@@ -471,11 +997,175 @@ cdef class DataFrame(object):
         else:
             return lst
 
-    def to_pandas(self, multi_index=True):
+    def to_numpy(self, skip_index=False):
+        """
+        Return a two-dimensional numpy array with the DataFrame data, with
+        one column per header. Numeric columns are copied directly from the
+        underlying buffers without creating Python objects per value.
+
+        Args:
+            skip_index: set to True to retrieve only values.
+
+        Returns:
+            A float64 array if all the columns are numeric (empty cells are
+            ``nan``), or an object array otherwise.
+        """
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        cdef size_t nrows, ncols, nindices, j
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumCols(self._c_df, &ncols))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(self._c_df, &nindices))
+        first = nindices if skip_index else 0
+        columns = [_column_to_numpy(self._c_df, j, 0, nrows) for j in range(first, ncols)]
+        if len(columns) == 0:
+            return np.empty((nrows, 0), dtype=np.float64)
+        return np.column_stack(columns)
+
+    def to_arrow(self):
+        """
+        Return a pyarrow.Table with the DataFrame data. The Arrow buffers are
+        filled directly from the DataFrame: numeric columns have type
+        float64 and string columns have type large_string. Empty cells
+        become nulls.
+        """
+        assert pa is not None, "Failed to import pyarrow. Ensure pyarrow is installed and importable."
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        cdef size_t nrows, ncols, j
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumCols(self._c_df, &ncols))
+        columns = [_column_to_arrow(self._c_df, j, 0, nrows) for j in range(ncols)]
+        return pa.Table.from_arrays(columns, names=self._get_headers())
+
+    def iter_batches(self, rows=65536, format="numpy"):
+        """
+        Iterate over the DataFrame in batches of consecutive rows, each one
+        converted in bulk. This allows processing large dataframes with
+        bounded memory.
+
+        Args:
+            rows: Maximum number of rows per batch.
+
+            format: ``"numpy"`` to get two-dimensional arrays as in
+            :func:`~amplpy.DataFrame.to_numpy`, ``"pandas"`` to get
+            pandas.DataFrame objects as in
+            :func:`~amplpy.DataFrame.to_pandas` with ``dtype_backend="numpy"``,
+            or ``"arrow"`` to get pyarrow.RecordBatch objects as in
+            :func:`~amplpy.DataFrame.to_arrow`.
+
+        Returns:
+            A generator over the batches.
+        """
+        cdef size_t nrows, ncols, start, stop, j
+        assert rows > 0
+        if format == "numpy":
+            assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        elif format == "pandas":
+            assert pd is not None, "Failed to import pandas. Ensure pandas is installed and importable."
+        elif format == "arrow":
+            assert pa is not None, "Failed to import pyarrow. Ensure pyarrow is installed and importable."
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumCols(self._c_df, &ncols))
+        headers = self._get_headers()
+        for start in range(0, nrows, rows):
+            stop = min(start + rows, nrows)
+            if format == "numpy":
+                columns = [_column_to_numpy(self._c_df, j, start, stop) for j in range(ncols)]
+                if len(columns) == 0:
+                    yield np.empty((stop - start, 0), dtype=np.float64)
+                else:
+                    yield np.column_stack(columns)
+            elif format == "pandas":
+                yield self._to_pandas_arrays(True, "numpy", start, stop)
+            else:
+                columns = [_column_to_arrow(self._c_df, j, start, stop) for j in range(ncols)]
+                yield pa.RecordBatch.from_arrays(columns, names=headers)
+
+    def to_polars(self):
+        """
+        Return a polars.DataFrame with the DataFrame data, built from the
+        Arrow buffers produced by :func:`~amplpy.DataFrame.to_arrow`.
+        """
+        assert pl is not None, "Failed to import polars. Ensure polars is installed and importable."
+        return pl.from_arrow(self.to_arrow())
+
+    def _axis_labels(self):
+        """
+        Get the distinct values of each column, in order of first
+        appearance.
+        """
+        cdef size_t nrows, ncols, j
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumCols(self._c_df, &ncols))
+        return [
+            _axis_codes(_column_to_numpy(self._c_df, j, 0, nrows))[0]
+            for j in range(ncols)
+        ]
+
+    def _to_dense(self, fill, axes=None):
+        """
+        Pivot the first data column into a dense array with one axis per
+        index column. The labels along each axis are taken from ``axes`` if
+        provided, or from the index columns in order of first appearance
+        otherwise (also for the axes set to None). Returns the array and the
+        labels along each axis.
+        """
+        cdef size_t nrows, ncols, nindices, j
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumCols(self._c_df, &ncols))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(self._c_df, &nindices))
+        if ncols <= nindices:
+            raise ValueError("The DataFrame has no data columns")
+        if axes is not None and len(axes) != nindices:
+            raise ValueError(f"Expected {nindices} axes, got {len(axes)}")
+        values = _column_to_numpy(self._c_df, nindices, 0, nrows)
+        labels, codes = [], []
+        for j in range(nindices):
+            column = _column_to_numpy(self._c_df, j, 0, nrows)
+            if axes is None or axes[j] is None:
+                axis_labels, axis_codes = _axis_codes(column)
+            else:
+                axis_labels = axes[j]
+                positions = {label: i for i, label in enumerate(axis_labels.tolist())}
+                try:
+                    axis_codes = np.fromiter(
+                        (positions[label] for label in column.tolist()),
+                        dtype=np.intp,
+                        count=nrows,
+                    )
+                except KeyError as e:
+                    raise ValueError(
+                        f"Index value {e.args[0]!r} is not in axis {j}"
+                    ) from None
+            labels.append(axis_labels)
+            codes.append(axis_codes)
+        if nindices == 0:
+            return values.reshape(()), labels
+        array = np.full(
+            tuple(len(axis) for axis in labels), fill, dtype=values.dtype
+        )
+        array[tuple(codes)] = values
+        return array, labels
+
+    def to_pandas(self, multi_index=True, dtype_backend=None):
         """
         Return a pandas.DataFrame with the DataFrame data.
+
+        Args:
+            multi_index: set to False to use tuples as index instead of a
+            MultiIndex when there are multiple index columns.
+
+            dtype_backend: by default, values are converted to Python objects
+            (integral values become ints). With ``"numpy"``, numeric columns
+            and index levels are float64 arrays copied directly from the
+            DataFrame, and string index levels are categorical. With
+            ``"pyarrow"``, the columns are backed by the Arrow arrays from
+            :func:`~amplpy.DataFrame.to_arrow`.
         """
         assert pd is not None, "Failed to import pandas. Ensure pandas is installed and importable."
+        if dtype_backend is not None:
+            return self._to_pandas_arrays(multi_index, dtype_backend)
         nindices = self._get_num_indices()
         headers = self._get_headers()
         columns = {
@@ -496,6 +1186,40 @@ cdef class DataFrame(object):
             else:
                 return pd.DataFrame(columns, index=index)
 
+    def _to_pandas_arrays(self, multi_index, dtype_backend, start=0, stop=None):
+        cdef size_t nrows, ncols, nindices, j
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(self._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumCols(self._c_df, &ncols))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(self._c_df, &nindices))
+        if stop is None:
+            stop = nrows
+        headers = self._get_headers()
+        if dtype_backend == "numpy":
+            assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+            arrays = [_column_to_numpy(self._c_df, j, start, stop) for j in range(ncols)]
+            levels = [
+                array if array.dtype != object else pd.Categorical(array)
+                for array in arrays[:nindices]
+            ]
+            columns = dict(zip(headers[nindices:], arrays[nindices:]))
+        elif dtype_backend == "pyarrow":
+            assert pa is not None, "Failed to import pyarrow. Ensure pyarrow is installed and importable."
+            arrays = [_column_to_arrow(self._c_df, j, start, stop) for j in range(ncols)]
+            arrays = [pd.array(array, dtype=pd.ArrowDtype(array.type)) for array in arrays]
+            levels = arrays[:nindices]
+            columns = dict(zip(headers[nindices:], arrays[nindices:]))
+        else:
+            raise ValueError(f"Unsupported dtype_backend: {dtype_backend}")
+        if nindices == 0:
+            return pd.DataFrame(columns, index=None)
+        if nindices >= 2 and multi_index is True:
+            index = pd.MultiIndex.from_arrays(levels, names=headers[:nindices])
+        elif nindices >= 2:
+            index = list(zip(*[np.asarray(level).tolist() for level in levels]))
+        else:
+            index = pd.Index(levels[0])
+        return pd.DataFrame(columns, index=index)
+
     @classmethod
     def from_dict(cls, dic, index_names=None, column_names=None):
         """
@@ -560,16 +1284,15 @@ cdef class DataFrame(object):
             df = df.stack()
             if isinstance(df, pd.Series):
                 df = pd.DataFrame(df)
-        if isinstance(df.index[0], tuple):
-            keys = df.index.tolist()
-        else:
-            keys = [(key,) for key in df.index]
-        index = [(f"index{i}", cindex) for i, cindex in enumerate(zip(*keys))]
+        index = [
+            (f"index{i}", _pandas_values(df.index.get_level_values(i)))
+            for i in range(df.index.nlevels)
+        ]
         if index_names is not None:
             assert len(index) == len(index_names)
             for i in range(len(index)):
                 index[i] = (index_names[i], index[i][1])
-        columns = [(str(cname), df[cname].tolist()) for cname in df.columns.tolist()]
+        columns = [(str(cname), _pandas_values(df[cname])) for cname in df.columns.tolist()]
         return cls(index=index, columns=columns)
 
     @classmethod
@@ -581,15 +1304,67 @@ cdef class DataFrame(object):
         if isinstance(data, np.ndarray):
             index = []
             if len(data.shape) == 1:
-                columns = [("value", data.tolist())]
+                columns = [("value", data)]
             elif len(data.shape) == 2:
-                columns = [(f"c{i}", col) for i, col in enumerate(zip(*data.tolist()))]
+                columns = [(f"c{i}", data[:, i]) for i in range(data.shape[1])]
             else:
                 raise TypeError
         else:
             raise TypeError
         return cls(index=index, columns=columns)
 
+    @classmethod
+    def from_arrow(cls, table, index=None):
+        """
+        Create a :class:`~amplpy.DataFrame` from a pyarrow Table or
+        RecordBatch. Numeric and string columns (including
+        dictionary-encoded strings) are read from the Arrow buffers.
+
+        Args:
+            table: pyarrow Table or RecordBatch to load.
+            index: names of the columns to use as index. By default, all
+            columns but the last one.
+        """
+        assert pa is not None, "Failed to import pyarrow. Ensure pyarrow is installed and importable."
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        assert isinstance(table, (pa.Table, pa.RecordBatch))
+        cdef DataFrame df
+        names = [str(name) for name in table.column_names]
+        if index is None:
+            index = names[: len(names) - 1]
+        elif isinstance(index, str):
+            index = [index]
+        else:
+            index = [str(name) for name in index]
+        columns = [name for name in names if name not in index]
+        df = cls(index=index, columns=columns)
+        for name in index + columns:
+            df._set_column_arrow(name, table.column(name))
+        return df
+
+    @classmethod
+    def from_polars(cls, df, index=None, indexarity=None):
+        """
+        Create a :class:`~amplpy.DataFrame` from a polars DataFrame. The data
+        is read through the Arrow buffers of the columns
+        (see :func:`~amplpy.DataFrame.from_arrow`).
+
+        Args:
+            df: Polars DataFrame to load.
+            index: names of the columns to use as index.
+            indexarity: number of leading columns to use as index if
+            ``index`` is not provided. By default, all columns but the last
+            one.
+        """
+        assert pl is not None, "Failed to import polars. Ensure polars is installed and importable."
+        if isinstance(df, pl.Series):
+            df = df.to_frame()
+        else:
+            assert isinstance(df, pl.DataFrame)
+        if index is None and indexarity is not None:
+            index = df.columns[:indexarity]
+        return cls.from_arrow(df.to_arrow(), index=index)
+
     @classmethod
     def _from_data_frame_ref(cls, df_ref):
         return cls(None, None, _impl=df_ref)
@@ -606,10 +1381,19 @@ cdef class DataFrame(object):
     _getRowByIndex = _get_row_by_index
     _setColumn = _set_column
     _setValues = _set_values
+    addRows = add_rows
+    buildIndex = build_index
+    fromArrow = from_arrow
     fromDict = from_dict
     fromNumpy = from_numpy
     fromPandas = from_pandas
+    fromPolars = from_polars
+    getRows = get_rows
+    iterBatches = iter_batches
+    toArrow = to_arrow
     toDict = to_dict
     toList = to_list
+    toNumpy = to_numpy
     toPandas = to_pandas
+    toPolars = to_polars
     toString = to_string
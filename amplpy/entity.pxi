@@ -2,11 +2,49 @@
 
 from libc.string cimport strdup
 
+import re
 
 try:
     import pandas as pd
 except ImportError:
     pd = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+def _indexing_set_expression(text):
+    """
+    Turn an item of :func:`~amplpy.Entity.get_indexing_sets` into a set
+    expression that can be displayed on its own, by dropping the dummy
+    indices (e.g., ``i in I``) and the condition (e.g., ``J: j > i``).
+    Returns the expression and the number of dummy indices, or None if
+    there are none.
+    """
+    depth = 0
+    quote = None
+    for i, c in enumerate(text):
+        if quote is not None:
+            if c == quote:
+                quote = None
+        elif c in "'\"":
+            quote = c
+        elif c in "({[":
+            depth += 1
+        elif c in ")}]":
+            depth -= 1
+        elif c == ":" and depth == 0:
+            text = text[:i]
+            break
+    match = re.match(r"\s*(\w+|\([^()]*\))\s+in\s+(.+)$", text, re.DOTALL)
+    if match is None:
+        return text.strip(), None
+    return match.group(2).strip(), match.group(1).count(",") + 1
 
 
 cdef class Entity(object):
@@ -42,7 +80,6 @@ cdef class Entity(object):
     cdef create(AMPL ampl, char *name, campl.AMPL_TUPLE* index, object parent):
         entity = Entity()
         entity._ampl = ampl
-        Py_INCREF(entity._ampl)
         entity._name = name
         entity._index = index
         cdef campl.AMPL_ERRORINFO* errorinfo
@@ -64,7 +101,6 @@ cdef class Entity(object):
             campl.AMPL_TupleFree(&self._index)
         else:
             campl.AMPL_StringFree(&self._name)
-        Py_DECREF(self._ampl)
 
     def to_string(self):
         cdef campl.AMPL_ERRORINFO* errorinfo
@@ -93,6 +129,7 @@ cdef class Entity(object):
             :class:`pandas.DataFrame` / :class:`pandas.Series` mapping
             indices to values.
         """
+        self._ampl._check_idle()
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef DataFrame df_typed
         if pd is not None and isinstance(value, pd.Series):
@@ -154,6 +191,7 @@ cdef class Entity(object):
         Returns:
             The corresponding instance.
         """
+        self._ampl._check_idle()
         cdef campl.AMPL_ERRORINFO* errorinfo
         assert self.wrap_function is not None
         cdef campl.AMPL_TUPLE* tuple_c
@@ -180,29 +218,55 @@ cdef class Entity(object):
         """
         Searches the current entity for an instance with the specified index.
 
+        The first search builds a hash index of the instances of the entity,
+        which is reused by later searches until a statement, a set
+        assignment or a parameter assignment may have changed the indexing
+        sets (see :func:`~amplpy.AMPL.eval`), or until the number of
+        instances changes (e.g., when a set is defined from the values of
+        variables and the model is solved).
+
         Returns:
             The wanted instance if found, otherwise it returns `None`.
         """
+        self._ampl._check_idle()
         assert self.wrap_function is not None
-        cdef campl.AMPL_ERRORINFO* errorinfo
-        cdef size_t i
-        cdef campl.AMPL_TUPLE* index_c = to_c_tuple(index)
-        cdef campl.AMPL_TUPLE** indices_c
+        if _index_key(index) not in self._instance_positions():
+            return None
+        return create_entity(self.wrap_function, self._ampl, self._name, to_c_tuple(index), self)
+
+    def find_many(self, keys):
+        """
+        Check which of the specified indices correspond to instances of this
+        entity, in a single pass over the keys.
+
+        Args:
+            keys: Iterable with the indices to look for (single values for
+            entities indexed over one dimension and tuples otherwise).
+
+        Returns:
+            A tuple ``(found, missing)`` of boolean masks aligned with
+            ``keys`` (numpy arrays if numpy is available, lists otherwise).
+        """
+        self._ampl._check_idle()
+        positions = self._instance_positions()
+        found = [_index_key(key) in positions for key in keys]
+        if np is not None:
+            found = np.array(found, dtype=np.bool_)
+            return found, ~found
+        return found, [not value for value in found]
+
+    def _instance_positions(self):
+        cdef IndexMap index_map = self._ampl._instance_indexes.get(<bytes>self._name)
         cdef size_t size
-        errorinfo = campl.AMPL_EntityGetTuples(self._ampl._c_ampl, self._name, &indices_c, &size)
-        if errorinfo:
-            PY_AMPL_CALL(errorinfo)
-        for i in range(size):
-            if campl.AMPL_TupleCompare(index_c, indices_c[i]) == 0:
-                for j in range(size):
-                    campl.AMPL_TupleFree(&indices_c[j])
-                free(indices_c)
-                return create_entity(self.wrap_function, self._ampl, self._name, index_c, self)
-        for i in range(size):
-            campl.AMPL_TupleFree(&indices_c[i])
-        free(indices_c)
-        campl.AMPL_TupleFree(&index_c)
-        return None
+        if index_map is not None:
+            # Sets defined from variable values change without data writes
+            PY_AMPL_CALL(campl.AMPL_EntityGetNumInstances(self._ampl._c_ampl, self._name, &size))
+            if size != index_map._num_instances:
+                index_map = None
+        if index_map is None:
+            index_map = IndexMap.create(self._ampl, self._name, None)
+            self._ampl._instance_indexes[<bytes>self._name] = index_map
+        return index_map._get_positions()
 
     def instances(self):
         """
@@ -308,6 +372,42 @@ cdef class Entity(object):
         free(xref)
         return pylist
 
+    def items(self, suffix=None, chunk_size=65536):
+        """
+        Iterate over the ``(index, value)`` pairs of all instances of this
+        entity without creating an object for each instance. The values are
+        fetched from AMPL in a single call and decoded in chunks, so only
+        ``chunk_size`` pairs are held as Python objects at a time.
+
+        Args:
+            suffix: Suffix to get (e.g., ``"ub"``), or ``None`` for the
+            principal values as in :func:`~amplpy.Entity.get_values`.
+
+            chunk_size: Number of instances decoded at a time.
+
+        Returns:
+            A generator of pairs with the index of each instance (a single
+            value for entities indexed over one dimension and a tuple
+            otherwise) and its value.
+        """
+        self._ampl._check_idle()
+        cdef DataFrame df
+        cdef size_t nrows, nindices, start, stop, j
+        assert chunk_size > 0
+        df = self.get_values(suffix)
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(df._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(df._c_df, &nindices))
+        for start in range(0, nrows, chunk_size):
+            stop = min(start + chunk_size, nrows)
+            values = _column_to_list(df._c_df, nindices, start, stop)
+            if nindices == 0:
+                keys = [()] * len(values)
+            elif nindices == 1:
+                keys = _column_to_list(df._c_df, 0, start, stop)
+            else:
+                keys = zip(*[_column_to_list(df._c_df, j, start, stop) for j in range(nindices)])
+            yield from zip(keys, values)
+
     def get_values(self, suffixes=None):
         """
         If a list of suffixes is provided, get the specified suffixes value for
@@ -328,6 +428,7 @@ cdef class Entity(object):
             A :class:`~amplpy.DataFrame` containing the values for all
             instances.
         """
+        self._ampl._check_idle()
         cdef campl.AMPL_DATAFRAME* df_c
         cdef char** suffixes_c
         cdef size_t n
@@ -350,6 +451,175 @@ cdef class Entity(object):
 
         return DataFrame.create(df_c)
 
+    def to_numpy(self, suffix=None, fill=float("nan")):
+        """
+        Get the values of this entity as a dense numpy array with one axis
+        per index position, following the order of the indexing sets.
+        Instances that are not defined (e.g., in sparse indexing sets) are
+        set to ``fill``.
+
+        Args:
+            suffix: suffix to retrieve. If not provided, the principal
+            values are returned (see :func:`~amplpy.Entity.get_values`).
+
+            fill: value for the positions with no corresponding instance.
+
+        Returns:
+            A tuple with the array and a list with the labels along each
+            axis: the members of the corresponding indexing set (or its
+            component, for sets of tuples), in set order. Axes whose set
+            cannot be evaluated on its own (e.g., ``j in ARCS[i]``) are
+            labelled in order of first appearance instead. The array has
+            type float64 unless the values are strings.
+        """
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        if suffix is None:
+            df = self.get_values()
+        else:
+            df = self.get_values([suffix])
+        nindices = df._get_num_indices()
+        axes = []
+        unknown = []
+        for expression in self.get_indexing_sets():
+            dimension = None
+            if expression is not None:
+                expression, dimension = _indexing_set_expression(expression)
+                try:
+                    axes.extend(self._ampl.get_data(expression)._axis_labels())
+                    continue
+                except (AMPLException, KeyError, RuntimeError, TypeError, ValueError):
+                    # Terms such as j in ARCS[i] depend on earlier dummies
+                    pass
+            if dimension is None:
+                unknown.append(len(axes))
+            else:
+                axes.extend([None] * dimension)
+        if len(unknown) == 1 and len(axes) < nindices:
+            axes[unknown[0]:unknown[0]] = [None] * (nindices - len(axes))
+        if len(axes) != nindices:
+            axes = None
+        return df._to_dense(fill, axes)
+
+    def index_map(self, keys=None):
+        """
+        Build an :class:`~amplpy.IndexMap` with the positions of the
+        instances of this entity, to be used with the positional bulk methods
+        :func:`~amplpy.Entity.get_array` and
+        :func:`~amplpy.Parameter.set_array`.
+
+        Args:
+            keys: keys of the instances to include in the map, in the desired
+            order. By default, all instances in the order of the entity.
+
+        Raises:
+            KeyError: If one of the keys does not correspond to an instance.
+        """
+        self._ampl._check_idle()
+        return IndexMap.create(self._ampl, self._name, keys)
+
+    def get_array(self, IndexMap index_map, suffix=None):
+        """
+        Get the values of the instances in an :class:`~amplpy.IndexMap` as
+        an array aligned to the positions in the map.
+
+        Maps with fewer than 64 keys are read one instance at a time. For
+        larger maps, the values of all the instances are fetched with a
+        single call and picked by position; the AMPL API has no positional
+        read, so the index tuples are transferred but never decoded.
+
+        Args:
+            index_map: map built with :func:`~amplpy.Entity.index_map`.
+
+            suffix: suffix to retrieve. If not provided, the principal
+            values are returned (see :func:`~amplpy.Entity.get_values`).
+
+        Returns:
+            A numpy array, with type float64 unless the values are strings.
+
+        Raises:
+            ValueError: If a key in the map is no longer an instance of the
+            entity.
+        """
+        self._ampl._check_idle()
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        cdef DataFrame df
+        cdef campl.AMPL_DATAFRAME* df_c
+        cdef size_t nrows, nindices
+        index_map._check_entity(self._name)
+        index_map._check_current()
+        if not index_map._full and index_map._size < KEYED_READ_LIMIT:
+            values = _get_instance_values(
+                self._ampl._c_ampl, self._name, index_map._tuples, index_map._size, suffix
+            )
+            if any(isinstance(value, str) for value in values):
+                return np.array(values, dtype=object)
+            return np.array(
+                [np.nan if value is None else value for value in values], dtype=np.float64
+            )
+        if suffix is None:
+            df = self.get_values()
+        else:
+            df = self.get_values([suffix])
+        df_c = df.get_ptr()
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(df_c, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(df_c, &nindices))
+        if nrows != index_map._num_instances:
+            raise ValueError("The index map is out of date, please rebuild it")
+        values = _column_to_numpy(df_c, nindices, 0, nrows)
+        if index_map._full:
+            return values
+        return values[index_map._rows]
+
+    def get_suffix_arrays(self, suffixes):
+        """
+        Get the values of multiple suffixes for all instances as aligned
+        numpy arrays, fetched with a single call to AMPL and decoded
+        directly from the DataFrame buffers.
+
+        Args:
+            suffixes: list of suffix names (e.g., ``["val", "lb", "ub"]``).
+
+        Returns:
+            A tuple with the index array, with one row per instance and one
+            column per index position, and a dictionary with one array per
+            suffix. Arrays have type float64 unless they contain strings.
+        """
+        self._ampl._check_idle()
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        cdef DataFrame df
+        cdef campl.AMPL_DATAFRAME* df_c
+        cdef size_t nrows, nindices, j
+        if isinstance(suffixes, str):
+            suffixes = [suffixes]
+        else:
+            suffixes = list(suffixes)
+        df = self.get_values(suffixes)
+        df_c = df.get_ptr()
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(df_c, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(df_c, &nindices))
+        columns = [_column_to_numpy(df_c, j, 0, nrows) for j in range(nindices)]
+        if len(columns) == 0:
+            index = np.empty((nrows, 0), dtype=np.float64)
+        else:
+            index = np.column_stack(columns)
+        values = {
+            suffix: _column_to_numpy(df_c, nindices + j, 0, nrows)
+            for j, suffix in enumerate(suffixes)
+        }
+        return index, values
+
+    def to_arrow(self):
+        """
+        Equivalent to ``Entity.get_values().``:func:`~amplpy.DataFrame.to_arrow`.
+        """
+        return self.get_values().to_arrow()
+
+    def to_polars(self):
+        """
+        Equivalent to ``Entity.get_values().``:func:`~amplpy.DataFrame.to_polars`.
+        """
+        return self.get_values().to_polars()
+
     def to_pandas(self, **kwargs):
         """
         Equivalent to ``Entity.get_values().``:func:`~amplpy.DataFrame.to_pandas`.
@@ -389,6 +659,7 @@ cdef class Entity(object):
         Args:
             data: The data to set the entity to.
         """
+        self._ampl._check_idle()
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef DataFrame df
         cdef campl.AMPL_DATAFRAME* df_c 
@@ -417,12 +688,25 @@ cdef class Entity(object):
                 if errorinfo:
                     PY_AMPL_CALL(errorinfo)
                 return
+            if pl is not None and isinstance(data, pl.DataFrame):
+                df = DataFrame.from_polars(data, indexarity=self.indexarity())
+                df_c = df.get_ptr()
+                errorinfo = campl.AMPL_EntitySetValues(self._ampl._c_ampl, _name_c, df_c)
+                campl.AMPL_StringFree(&_name_c)
+                if errorinfo:
+                    PY_AMPL_CALL(errorinfo)
+                return
+            campl.AMPL_StringFree(&_name_c)
             raise TypeError(f"Unexpected data type: {type(data)}.")
 
     # Aliases
     toString = to_string
+    findMany = find_many
+    getArray = get_array
     getIndexingSets = get_indexing_sets
+    getSuffixArrays = get_suffix_arrays
     getValues = get_values
+    indexMap = index_map
     isScalar = is_scalar
     numInstances = num_instances
     setValues = set_values
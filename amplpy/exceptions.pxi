@@ -58,3 +58,16 @@ class PresolveException(RuntimeError):
 
 class InfeasibilityException(RuntimeError):
     pass
+
+
+class SolveTimeoutError(TimeoutError):
+    """
+    Raised by :func:`~amplpy.AMPL.solve` when the solve is interrupted
+    because its timeout expired. The solution found so far is loaded, and
+    the output of the solve is available in ``output`` if it was requested
+    with ``return_output=True``.
+    """
+
+    def __init__(self, message, output=None):
+        super(SolveTimeoutError, self).__init__(message)
+        self.output = output
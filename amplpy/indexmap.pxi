@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+from libc.stdlib cimport calloc, free
+from libc.string cimport strdup, strcmp
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+cdef class IndexMap(object):
+    """
+    Positional map of the instances of an indexed entity, built once from
+    the index tuples of the entity and reused across calls.
+
+    Methods such as :func:`~amplpy.Parameter.set_array` and
+    :func:`~amplpy.Entity.get_array` use it to exchange arrays of values
+    aligned to the positions in the map instead of sending or parsing the
+    index tuples on each call.
+
+    After AMPL may have changed the indexing sets of the entity (e.g.,
+    after :func:`~amplpy.AMPL.eval`), the map is checked against the
+    instances on its next use: values are then exchanged by key if the
+    instances are no longer in the order of the map, and a
+    ``ValueError`` is raised if a key is no longer an instance.
+
+    Maps are created with :func:`~amplpy.Entity.index_map`.
+    """
+    cdef AMPL _ampl
+    cdef char* _name
+    cdef campl.AMPL_TUPLE** _tuples
+    cdef size_t _size
+    cdef size_t _num_instances
+    cdef size_t _version
+    cdef bint _full
+    cdef object _rows
+    cdef object _keys
+    cdef object _positions
+
+    @staticmethod
+    cdef create(AMPL ampl, char* name, keys):
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef campl.AMPL_TUPLE** tuples
+        cdef size_t size, i
+        cdef IndexMap index_map = IndexMap.__new__(IndexMap)
+        index_map._ampl = ampl
+        index_map._name = strdup(name)
+        index_map._version = ampl._data_version
+        errorinfo = campl.AMPL_EntityGetTuples(ampl._c_ampl, name, &tuples, &size)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+        index_map._num_instances = size
+        if keys is None:
+            index_map._tuples = tuples
+            index_map._size = size
+            index_map._full = True
+            return index_map
+        try:
+            positions = {_index_key(to_py_tuple(tuples[i])): i for i in range(size)}
+        finally:
+            for i in range(size):
+                campl.AMPL_TupleFree(&tuples[i])
+            free(tuples)
+        keys = [_index_key(key) for key in keys]
+        try:
+            rows = [positions[key] for key in keys]
+        except KeyError as e:
+            raise KeyError(e.args[0]) from None
+        index_map._rows = np.array(rows, dtype=np.intp) if np is not None else rows
+        index_map._keys = keys
+        index_map._size = len(keys)
+        index_map._full = False
+        index_map._tuples = <campl.AMPL_TUPLE**> calloc(max(index_map._size, 1), sizeof(campl.AMPL_TUPLE*))
+        for i in range(index_map._size):
+            index_map._tuples[i] = to_c_tuple(keys[i])
+        return index_map
+
+    def __init__(self):
+        raise TypeError("Index maps are created with Entity.index_map")
+
+    def __dealloc__(self):
+        cdef size_t i
+        if self._tuples != NULL:
+            for i in range(self._size):
+                if self._tuples[i] != NULL:
+                    campl.AMPL_TupleFree(&self._tuples[i])
+            free(self._tuples)
+        if self._name != NULL:
+            free(self._name)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        return _index_key(key) in self._get_positions()
+
+    def name(self):
+        """
+        Get the name of the entity this map was built from.
+        """
+        return self._name.decode('utf-8')
+
+    def keys(self):
+        """
+        Get the keys in the map, in positional order. Keys are single values
+        for entities indexed over one dimension and tuples otherwise.
+        """
+        cdef size_t i
+        if self._keys is None:
+            self._keys = [_index_key(to_py_tuple(self._tuples[i])) for i in range(self._size)]
+        return list(self._keys)
+
+    def position(self, key):
+        """
+        Get the position of a key in the map.
+
+        Raises:
+            KeyError: If the key is not in the map.
+        """
+        try:
+            return self._get_positions()[_index_key(key)]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def _get_positions(self):
+        if self._positions is None:
+            self._positions = {key: i for i, key in enumerate(self.keys())}
+        return self._positions
+
+    cdef _check_entity(self, char* name):
+        if strcmp(self._name, name) != 0:
+            raise ValueError(
+                f"The index map was built for {self.name()}, not {name.decode('utf-8')}"
+            )
+
+    cdef bint _in_entity_order(self) except *:
+        """
+        Check whether the map covers all the instances of the entity in the
+        order of the entity.
+        """
+        self._check_current()
+        return self._full
+
+    cdef _check_current(self):
+        """
+        Compare the map with the instances of the entity if AMPL may have
+        changed them since the last check, and update the positions of the
+        keys in the entity.
+        """
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef campl.AMPL_TUPLE** tuples
+        cdef size_t size, i
+        cdef bint same
+        PY_AMPL_CALL(campl.AMPL_EntityGetNumInstances(self._ampl._c_ampl, self._name, &size))
+        if self._version == self._ampl._data_version and size == self._num_instances:
+            return
+        errorinfo = campl.AMPL_EntityGetTuples(self._ampl._c_ampl, self._name, &tuples, &size)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+        try:
+            same = size == self._size
+            i = 0
+            while same and i < size:
+                same = campl.AMPL_TupleCompare(tuples[i], self._tuples[i]) == 0
+                i += 1
+            if same:
+                rows = None
+            else:
+                positions = {_index_key(to_py_tuple(tuples[i])): i for i in range(size)}
+                try:
+                    rows = [positions[key] for key in self.keys()]
+                except KeyError as e:
+                    raise ValueError(
+                        f"The index map is out of date ({e.args[0]!r} is no longer "
+                        f"an instance of {self.name()}), please rebuild it"
+                    ) from None
+                if np is not None:
+                    rows = np.array(rows, dtype=np.intp)
+        finally:
+            for i in range(size):
+                campl.AMPL_TupleFree(&tuples[i])
+            free(tuples)
+        self._full = same
+        self._rows = rows
+        self._num_instances = size
+        self._version = self._ampl._data_version
@@ -25,7 +25,6 @@ cdef class Objective(Entity):
     cdef create(AMPL ampl, char* name, campl.AMPL_TUPLE* index, parent):
         entity = Objective()
         entity._ampl = ampl
-        Py_INCREF(entity._ampl)
         entity._name = name
         entity._index = index
         entity.wrap_function = campl.AMPL_OBJECTIVE
@@ -3,8 +3,6 @@ from numbers import Real
 from collections.abc import Iterable
 
 
-import itertools
-
 try:
     import pandas as pd
 except ImportError:
@@ -13,7 +11,27 @@ try:
     import numpy as np
 except ImportError:
     np = None
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
 
+cdef inline bint _same_value(previous, value):
+    # NaN compares equal to itself, as in the array comparison
+    return previous == value or (previous != previous and value != value)
+
+
+cdef bint _has_same_instances(IndexMap index_map) except *:
+    """
+    Check whether a map built for all the instances of an entity still
+    matches them in the same order.
+    """
+    try:
+        return index_map._in_entity_order()
+    except ValueError:
+        return False
 
 
 cdef class Parameter(Entity):
@@ -32,7 +50,6 @@ cdef class Parameter(Entity):
     cdef create(AMPL ampl, char* name, campl.AMPL_TUPLE* index, parent):
         entity = Parameter()
         entity._ampl = ampl
-        Py_INCREF(entity._ampl)
         entity._name = name
         entity._index = index
         entity.wrap_function = campl.AMPL_PARAMETER
@@ -76,6 +93,11 @@ cdef class Parameter(Entity):
         return value
 
     def __getitem__(self, index):
+        self._ampl._check_idle()
+        if np is not None and isinstance(index, np.ndarray):
+            return self.get_many(index.tolist())
+        if isinstance(index, list) and index and all(isinstance(key, (tuple, list)) for key in index):
+            return self.get_many(index)
         if not isinstance(index, (tuple, list)):
             index = [index]
         cdef campl.AMPL_ERRORINFO* errorinfo
@@ -94,10 +116,53 @@ cdef class Parameter(Entity):
         campl.AMPL_VariantFree(&v)
         return py_variant
 
+    def get_many(self, keys):
+        """
+        Get the values of multiple instances of this parameter. The values of
+        all instances are fetched with a single call to AMPL and picked by
+        position, instead of evaluating an expression per instance.
+
+        Indexing the parameter with a numpy array of keys, or with a list of
+        tuples, is equivalent to calling this method.
+
+        Args:
+            keys: Iterable with the indices of the instances (single values
+            for parameters indexed over one dimension and tuples otherwise).
+
+        Returns:
+            The values in the order of the keys, as a numpy array if numpy is
+            available (with type float64 unless the values are strings) or a
+            list otherwise.
+
+        Raises:
+            KeyError: If a key is not an instance of the parameter.
+        """
+        self._ampl._check_idle()
+        cdef DataFrame df
+        cdef size_t nrows, nindices
+        positions = self._instance_positions()
+        keys = [_index_key(key) for key in keys]
+        try:
+            rows = [positions[key] for key in keys]
+        except KeyError as e:
+            raise KeyError(e.args[0]) from None
+        df = self.get_values()
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumRows(df._c_df, &nrows))
+        PY_AMPL_CALL(campl.AMPL_DataFrameGetNumIndices(df._c_df, &nindices))
+        if nrows != <size_t>len(positions):
+            raise ValueError(
+                f"The instances of {self.name()} changed while reading them"
+            )
+        if np is not None:
+            return _column_to_numpy(df._c_df, nindices, 0, nrows)[np.array(rows, dtype=np.intp)]
+        values = _column_to_list(df._c_df, nindices, 0, nrows)
+        return [values[row] for row in rows]
+
     def value(self):
         """
         Get the value of this parameter. Valid only for non-indexed parameters.
         """
+        self._ampl._check_idle()
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_VARIANT* v
         errorinfo = campl.AMPL_GetValue(self._ampl._c_ampl, self._name, &v)
@@ -122,9 +187,11 @@ cdef class Parameter(Entity):
             TypeError: If the parameter is not scalar and the index is not
             provided.
         """
+        self._ampl._check_idle()
         assert len(args) in (1, 2)
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef campl.AMPL_TUPLE* index_c
+        self._values_changed()
         if len(args) == 1:
             value = args[0]
     
@@ -151,7 +218,7 @@ cdef class Parameter(Entity):
         if errorinfo:
             PY_AMPL_CALL(errorinfo)
 
-    def set_values(self, values):
+    def set_values(self, values, labels=None):
         """
         Assign the values (string or float) to the parameter instances with the
         specified indices, equivalent to the AMPL code:
@@ -160,14 +227,35 @@ cdef class Parameter(Entity):
 
             let {i in indices} par[i] := values[i];
 
+        Dense numpy arrays are assigned in a single call. Without labels,
+        their values are taken in row-major order, which matches the order
+        of the instances of a parameter indexed over the cartesian product
+        of its indexing sets.
+
         Args:
-            values: list, dictionary or :class:`~amplpy.DataFrame` with the
-            indices and the values to be set.
+            values: list, dictionary, numpy array, pandas or polars
+            object, or :class:`~amplpy.DataFrame` with the indices and the
+            values to be set. Polars series are assigned like numpy arrays.
+
+            labels: for numpy arrays only, a sequence with the labels along
+            each axis of the array (e.g., ``(rows, columns)`` for a matrix).
 
         Raises:
             TypeError: If called on a scalar parameter.
+
+            ValueError: If the labels do not match the shape of the array.
         """
+        self._ampl._check_idle()
         cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef _ArgsBuffer args
+        self._values_changed()
+        if pl is not None and isinstance(values, pl.Series):
+            values = values.to_numpy()
+        if np is not None and isinstance(values, np.ndarray):
+            self._set_values_array(values, labels)
+            return
+        if labels is not None:
+            raise ValueError("labels are only supported for numpy arrays")
         if isinstance(values, dict):
             if not values:
                 return
@@ -178,21 +266,17 @@ cdef class Parameter(Entity):
             Entity.set_values(self, values)
         elif pd is not None and isinstance(values, (pd.DataFrame, pd.Series)):
             Entity.set_values(self, values)
-        elif np is not None and isinstance(values, np.ndarray):
-            if len(values.shape) <= 1:
-                self.set_values(values.tolist())
-            else:
-                self.set_values(tuple(itertools.chain(*values.tolist())))
+        elif pl is not None and isinstance(values, pl.DataFrame):
+            Entity.set_values(self, values)
         elif isinstance(values, Iterable):
-            if all(isinstance(value, str) for value in values):
-                if not isinstance(values, (list, tuple)):
-                    values = list(values)
-                errorinfo = setValuesParamStr(self._ampl._c_ampl, self._name, values)
-                if errorinfo:
-                    PY_AMPL_CALL(errorinfo)
-            elif all(isinstance(value, Real) for value in values):
-                values = list(map(float, values))
-                errorinfo = setValuesParamNum(self._ampl._c_ampl, self._name, values)
+            if not isinstance(values, (list, tuple)):
+                values = list(values)
+            kind = _column_kind(values)
+            if kind != KIND_MIXED:
+                args = _ArgsBuffer(values, kind)
+                errorinfo = campl.AMPL_ParameterSetArgsValues(
+                    self._ampl._c_ampl, self._name, len(values), args._c_args
+                )
                 if errorinfo:
                     PY_AMPL_CALL(errorinfo)
             else:
@@ -200,7 +284,241 @@ cdef class Parameter(Entity):
         else:
             Entity.set_values(self, values)
 
+    def set_array(self, IndexMap index_map, values):
+        """
+        Assign the values of an array to the instances in an
+        :class:`~amplpy.IndexMap`, by position. Only the values are sent
+        when the map covers all instances of the parameter in their order;
+        otherwise, the index tuples cached in the map are reused.
+
+        Args:
+            index_map: map built with :func:`~amplpy.Entity.index_map`.
+
+            values: array (or list) of numbers or strings with one value
+            per position in the map.
+
+        Raises:
+            ValueError: If the size of the array does not match the map.
+        """
+        self._ampl._check_idle()
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef const double[::1] buffer
+        cdef char** c_string_array
+        cdef size_t size = index_map._size
+        cdef size_t i
+        index_map._check_entity(self._name)
+        self._values_changed()
+        values = np.asarray(values)
+        if values.size != size:
+            raise ValueError(
+                f"Expected {size} values for the index map, got {values.size}"
+            )
+        if size == 0:
+            return
+        if values.dtype.kind in "biuf":
+            buffer = np.ascontiguousarray(values, dtype=np.float64).ravel()
+            if index_map._in_entity_order():
+                errorinfo = campl.AMPL_ParameterSetArgsDoubleValues(
+                    self._ampl._c_ampl, self._name, size, &buffer[0]
+                )
+            else:
+                errorinfo = campl.AMPL_ParameterSetSomeDoubleValues(
+                    self._ampl._c_ampl, self._name, size, index_map._tuples, <double*>&buffer[0]
+                )
+        else:
+            encoded = [str(value).encode('utf-8') for value in values.ravel().tolist()]
+            c_string_array = <char**> malloc(size * sizeof(char*))
+            for i in range(size):
+                c_string_array[i] = encoded[i]
+            if index_map._in_entity_order():
+                errorinfo = campl.AMPL_ParameterSetArgsStringValues(
+                    self._ampl._c_ampl, self._name, size, <const char* const*>c_string_array
+                )
+            else:
+                errorinfo = campl.AMPL_ParameterSetSomeStringValues(
+                    self._ampl._c_ampl, self._name, size, index_map._tuples, c_string_array
+                )
+            free(c_string_array)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+
+    def sync(self, values):
+        """
+        Assign values to the parameter sending only the entries that changed
+        since the previous call to this method, which is useful when a model
+        is solved repeatedly with data that changes a little each time.
+
+        The values pushed by the last call are kept as a shadow copy and
+        compared against the new ones; the first call (or the first after
+        the shadow is discarded) sends all entries. The shadow is discarded
+        when the parameter is assigned by any other method, when its
+        instances change, and whenever AMPL may have changed the data: after :func:`~amplpy.AMPL.eval`,
+        :func:`~amplpy.AMPL.get_output`, :func:`~amplpy.AMPL.read`, :func:`~amplpy.AMPL.read_data`,
+        :func:`~amplpy.AMPL.read_table`, :func:`~amplpy.AMPL.set_data`, and
+        :func:`~amplpy.AMPL.reset`.
+
+        Args:
+            values: dictionary with the indices and the values to be set,
+            or a numpy array with one value per instance of the parameter,
+            in the order of the instances (see
+            :func:`~amplpy.Entity.index_map`).
+
+        Returns:
+            The number of entries sent to AMPL.
+
+        Raises:
+            ValueError: If the size of the array does not match the number
+            of instances of the parameter.
+        """
+        self._ampl._check_idle()
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef IndexMap index_map
+        shadows = self._ampl._param_shadows
+        key = <bytes>self._name
+        shadow = shadows.get(key)
+        if isinstance(values, dict):
+            if not isinstance(shadow, dict):
+                shadow = {}
+            changed = {
+                index: value
+                for index, value in values.items()
+                if index not in shadow or not _same_value(shadow[index], value)
+            }
+            if changed:
+                self._ampl._clear_instance_indexes()
+                errorinfo = setValuesPyDict(self._ampl._c_ampl, self._name, changed)
+                if errorinfo:
+                    PY_AMPL_CALL(errorinfo)
+            shadow.update(changed)
+            shadows[key] = shadow
+            return len(changed)
+        assert np is not None, "Failed to import numpy. Ensure numpy is installed and importable."
+        values = np.array(values).ravel()
+        if (
+            isinstance(shadow, tuple)
+            and shadow[1].shape == values.shape
+            and shadow[1].dtype == values.dtype
+            and _has_same_instances(shadow[0])
+        ):
+            index_map, previous = shadow
+            changed = values != previous
+            if values.dtype.kind == "f":
+                changed &= ~(np.isnan(values) & np.isnan(previous))
+            positions = np.flatnonzero(changed)
+            self._set_positions(index_map, values, positions)
+            count = len(positions)
+        else:
+            index_map = IndexMap.create(self._ampl, self._name, None)
+            self.set_array(index_map, values)
+            count = len(values)
+        shadows[key] = (index_map, values)
+        return count
+
+    cdef _values_changed(self):
+        # Sets defined from the values of the parameter may change too
+        self._ampl._param_shadows.pop(<bytes>self._name, None)
+        self._ampl._clear_instance_indexes()
+
+    cdef _set_positions(self, IndexMap index_map, values, positions):
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef const double[::1] buffer
+        cdef const Py_ssize_t[::1] rows = np.ascontiguousarray(positions, dtype=np.intp)
+        cdef campl.AMPL_TUPLE** tuples
+        cdef char** c_string_array
+        cdef size_t size = rows.shape[0]
+        cdef size_t i
+        if size == 0:
+            return
+        index_map._check_current()
+        self._ampl._clear_instance_indexes()
+        tuples = <campl.AMPL_TUPLE**> malloc(size * sizeof(campl.AMPL_TUPLE*))
+        for i in range(size):
+            tuples[i] = index_map._tuples[rows[i]]
+        values = values[positions]
+        if values.dtype.kind in "biuf":
+            buffer = np.ascontiguousarray(values, dtype=np.float64)
+            errorinfo = campl.AMPL_ParameterSetSomeDoubleValues(
+                self._ampl._c_ampl, self._name, size, tuples, <double*>&buffer[0]
+            )
+        else:
+            encoded = [str(value).encode('utf-8') for value in values.tolist()]
+            c_string_array = <char**> malloc(size * sizeof(char*))
+            for i in range(size):
+                c_string_array[i] = encoded[i]
+            errorinfo = campl.AMPL_ParameterSetSomeStringValues(
+                self._ampl._c_ampl, self._name, size, tuples, c_string_array
+            )
+            free(c_string_array)
+        free(tuples)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+
+    def _set_values_array(self, values, labels):
+        cdef campl.AMPL_ERRORINFO* errorinfo
+        cdef const double[::1] buffer
+        cdef const double* c_double_array = NULL
+        cdef _ArgsBuffer rows, cols
+        numeric = values.dtype.kind in "biuf"
+        if labels is None:
+            if not numeric:
+                self.set_values(values.ravel().tolist())
+                return
+            buffer = np.ascontiguousarray(values, dtype=np.float64).ravel()
+            if buffer.shape[0] > 0:
+                c_double_array = &buffer[0]
+            errorinfo = campl.AMPL_ParameterSetArgsDoubleValues(
+                self._ampl._c_ampl, self._name, buffer.shape[0], c_double_array
+            )
+            if errorinfo:
+                PY_AMPL_CALL(errorinfo)
+            return
+        labels = [list(axis) for axis in labels]
+        if len(labels) != values.ndim:
+            raise ValueError(
+                f"expected labels for {values.ndim} axes, got {len(labels)}"
+            )
+        for axis, size in zip(labels, values.shape):
+            if len(axis) != size:
+                raise ValueError(
+                    f"labels do not match the shape {values.shape} of the array"
+                )
+        if values.size == 0:
+            return
+        if values.ndim == 2 and numeric:
+            rows = _ArgsBuffer(labels[0])
+            cols = _ArgsBuffer(labels[1])
+            buffer = np.ascontiguousarray(values, dtype=np.float64).ravel()
+            errorinfo = campl.AMPL_ParameterSetValuesMatrix(
+                self._ampl._c_ampl,
+                self._name,
+                values.shape[0],
+                rows._c_args,
+                values.shape[1],
+                cols._c_args,
+                &buffer[0],
+                False,
+            )
+            if errorinfo:
+                PY_AMPL_CALL(errorinfo)
+            return
+        index = []
+        for i, axis in enumerate(labels):
+            numeric_axis = all(isinstance(label, Real) for label in axis)
+            axis = np.asarray(axis, dtype=None if numeric_axis else object)
+            column = np.tile(
+                np.repeat(axis, int(np.prod(values.shape[i + 1 :]))),
+                int(np.prod(values.shape[:i])),
+            )
+            index.append((f"index{i}", column))
+        column = values.ravel()
+        if not numeric:
+            column = column.tolist()
+        Entity.set_values(self, DataFrame(index=index, columns=[("value", column)]))
+
     # Aliases
+    getMany = get_many
     hasDefault = has_default
     isSymbolic = is_symbolic
+    setArray = set_array
     setValues = set_values
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from amplpy.ampl import AMPL
+
+# Marker put in the queue of a closed pool
+_CLOSED = object()
+
+
+def _initialize(init, environment):
+    ampl = AMPL(environment) if environment is not None else AMPL()
+    try:
+        if callable(init):
+            init(ampl)
+        elif init is not None:
+            if isinstance(init, (str, os.PathLike)):
+                init = [init]
+            for filename in init:
+                if str(filename).endswith(".dat"):
+                    ampl.read_data(filename)
+                else:
+                    ampl.read(filename)
+    except BaseException:
+        ampl.close()
+        raise
+    return ampl
+
+
+class AMPLPool(object):
+    """
+    A pool of AMPL objects initialized once and reused across tasks, to
+    avoid starting a new interpreter and loading the model for each one.
+
+    Sessions are handed out with :func:`~amplpy.AMPLPool.session` or used
+    in parallel with :func:`~amplpy.AMPLPool.map`. When a session is
+    returned to the pool, its state is reset to the state after the
+    initialization, and sessions whose interpreter is no longer running are
+    replaced with new ones.
+
+    .. code-block:: python
+
+        def solve(ampl, demand):
+            ampl.param["demand"] = demand
+            ampl.solve(verbose=False)
+            return ampl.get_value("cost")
+
+        with AMPLPool(4, init="model.mod") as pool:
+            costs = pool.map(solve, scenarios)
+    """
+
+    def __init__(self, size=None, init=None, reset="data", environment=None):
+        """
+        Create the pool and start its sessions.
+
+        Args:
+            size: Number of sessions (defaults to the number of CPUs).
+
+            init: Function called with each new :class:`~amplpy.AMPL` object
+            to initialize it, or a path or list of paths of model files to
+            read (files ending in ``.dat`` are read as data files).
+
+            reset: State restored when a session is returned to the pool:
+            ``"data"`` to restore the data and options after the
+            initialization, ``"all"`` to also restore the model (e.g., if
+            tasks add declarations), or ``None`` to keep the state left by
+            the last task.
+
+            environment: :class:`~amplpy.Environment` for the sessions.
+
+        Raises:
+            ValueError: If ``size`` is not positive or ``reset`` is not one
+            of the values above.
+        """
+        if reset not in ("data", "all", None):
+            raise ValueError(f"Unexpected reset mode: {reset}")
+        if size is None:
+            size = os.cpu_count() or 1
+        if size <= 0:
+            raise ValueError(f"The size of the pool must be positive, got {size}")
+        self._size = size
+        self._init = init
+        self._reset = reset
+        self._environment = environment
+        self._snapshot = None
+        self._idle = queue.Queue()
+        self._closed = False
+        try:
+            for _ in range(size):
+                self._idle.put(self._spawn())
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self):
+        return self._size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @contextmanager
+    def session(self):
+        """
+        Check out a session from the pool for the duration of a ``with``
+        block, waiting until one is available:
+
+        .. code-block:: python
+
+            with pool.session() as ampl:
+                ampl.solve()
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+        """
+        ampl = self._checkout()
+        try:
+            yield ampl
+        finally:
+            self._checkin(ampl)
+
+    def map(self, fn, scenarios):
+        """
+        Call ``fn(ampl, scenario)`` for each scenario, running up to one call
+        per session in parallel.
+
+        Args:
+            fn: Function taking a session and a scenario.
+
+            scenarios: Iterable with the scenarios.
+
+        Returns:
+            A list with the results of the calls, in the order of the
+            scenarios.
+        """
+
+        def run(scenario):
+            with self.session() as ampl:
+                return fn(ampl, scenario)
+
+        with ThreadPoolExecutor(max_workers=self._size) as executor:
+            return list(executor.map(run, scenarios))
+
+    def close(self):
+        """
+        Close all the sessions. Sessions checked out at this point are
+        closed when they are returned to the pool, and calls waiting for a
+        session raise ``RuntimeError``.
+        """
+        self._closed = True
+        while True:
+            try:
+                ampl = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(ampl)
+        # Wake up the calls waiting for a session
+        self._idle.put(_CLOSED)
+
+    def _spawn(self):
+        ampl = _initialize(self._init, self._environment)
+        if self._reset is not None and self._snapshot is None:
+            self._snapshot = ampl.snapshot(model=self._reset == "all")
+        return ampl
+
+    def _checkout(self):
+        if self._closed:
+            raise RuntimeError("The pool has been closed")
+        ampl = self._idle.get()
+        if ampl is _CLOSED:
+            self._idle.put(_CLOSED)
+            raise RuntimeError("The pool has been closed")
+        try:
+            running = ampl is not None and ampl.is_running()
+        except Exception:
+            running = False
+        if not running:
+            self._discard(ampl)
+            try:
+                ampl = self._spawn()
+            except BaseException:
+                # Keep the slot so that the next checkout tries again
+                self._idle.put(None)
+                raise
+        return ampl
+
+    def _checkin(self, ampl):
+        if self._closed:
+            self._discard(ampl)
+            return
+        try:
+            if self._reset == "data":
+                ampl.eval("reset data;")
+                ampl.eval(self._snapshot)
+            elif self._reset == "all":
+                ampl.reset()
+                ampl.eval(self._snapshot)
+        except Exception:
+            # The session is replaced on its next checkout
+            self._discard(ampl)
+            ampl = None
+        self._idle.put(ampl)
+
+    def _discard(self, ampl):
+        if ampl is None or ampl is _CLOSED:
+            return
+        try:
+            ampl.close()
+        except Exception:
+            pass
+
+
+class AMPLTemplate(object):
+    """
+    A template for AMPL objects that start with a model (and base data)
+    already loaded, for workloads that create sessions in bursts.
+
+    The template is initialized once and its state is captured as a
+    snapshot. A background thread keeps ``prespawn`` sessions started and
+    loaded from the snapshot, so :func:`~amplpy.AMPL.from_template` returns
+    a ready session without waiting for the interpreter to start or for the
+    model files to be read.
+
+    Creation is only fast while ready sessions remain: each one still
+    starts an interpreter and loads the snapshot, one at a time on the
+    background thread. Requests beyond the ``prespawn`` ready sessions wait
+    for that full startup in turn, so ``prespawn`` should cover the
+    expected size of a burst.
+
+    .. code-block:: python
+
+        template = AMPLTemplate(init=["model.mod", "base.dat"], prespawn=4)
+        ampl = AMPL.from_template(template)
+    """
+
+    def __init__(self, init=None, prespawn=1, environment=None):
+        """
+        Create the template and start the first sessions.
+
+        Args:
+            init: Function called with an :class:`~amplpy.AMPL` object to
+            initialize the template, or a path or list of paths of model
+            files to read (files ending in ``.dat`` are read as data files).
+
+            prespawn: Number of sessions to keep ready.
+
+            environment: :class:`~amplpy.Environment` for the sessions.
+
+        Raises:
+            ValueError: If ``prespawn`` is not positive.
+        """
+        if prespawn <= 0:
+            raise ValueError(
+                f"The number of sessions to prespawn must be positive, got {prespawn}"
+            )
+        self._environment = environment
+        self._ready = queue.Queue()
+        self._wanted = threading.Semaphore(prespawn - 1)
+        self._closed = False
+        ampl = _initialize(init, environment)
+        self._snapshot = ampl.snapshot()
+        self._ready.put(ampl)
+        self._thread = threading.Thread(target=self._prespawn, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def new_session(self):
+        """
+        Get a new :class:`~amplpy.AMPL` object with the state of the
+        template, waiting for one to be ready if needed (which takes as long
+        as starting a session and loading the snapshot). The caller owns the
+        session and is responsible for closing it.
+
+        Raises:
+            RuntimeError: If the template has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("The template has been closed")
+        self._wanted.release()
+        ampl = self._ready.get()
+        if isinstance(ampl, Exception):
+            raise ampl
+        return ampl
+
+    def close(self):
+        """
+        Stop starting new sessions and close the ones not handed out yet.
+        """
+        self._closed = True
+        self._wanted.release()
+        self._thread.join()
+        while True:
+            try:
+                ampl = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(ampl, AMPL):
+                ampl.close()
+
+    def _prespawn(self):
+        while True:
+            self._wanted.acquire()
+            if self._closed:
+                break
+            try:
+                ampl = _initialize(None, self._environment)
+                ampl.eval(self._snapshot)
+            except Exception as exp:
+                self._ready.put(exp)
+            else:
+                self._ready.put(ampl)
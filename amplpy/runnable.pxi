@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+
+
+# Maximum time in seconds to wait for the interpreter to stop when it is
+# interrupted
+INTERRUPT_TIMEOUT = 10.0
+
+
+cdef class _AsyncCall(object):
+    """
+    Completion state of an asynchronous call to the AMPL interpreter. The
+    interpreter calls :func:`_async_call_done` from its own thread when the
+    call finishes, which sets the event of the call and, for calls started
+    from an event loop, resolves the future in that loop.
+    """
+    cdef AMPL _ampl
+    cdef object _loop
+    cdef object _future
+    cdef object _event
+    cdef bytes _argument
+
+    @staticmethod
+    cdef create(AMPL ampl, argument, bint blocking=False):
+        ampl._check_idle()
+        call = _AsyncCall()
+        call._ampl = ampl
+        call._event = threading.Event()
+        call._argument = argument.encode('utf-8') if argument is not None else None
+        if not blocking:
+            call._loop = asyncio.get_running_loop()
+            call._future = call._loop.create_future()
+            call._future.add_done_callback(call._cancelled)
+        return call
+
+    cdef start(self, campl.AMPL_ERRORINFO* errorinfo):
+        """
+        Check the result of starting the call. On success, the interpreter
+        holds a reference to this object until the completion callback runs,
+        and other calls on the AMPL object are rejected until then.
+        """
+        if errorinfo:
+            Py_DECREF(self)
+            PY_AMPL_CALL(errorinfo)
+        self._ampl._pending_call = self
+        return self._future
+
+    def wait(self, timeout=None):
+        """
+        Wait for the call to finish. If it does not finish within the timeout
+        (or the wait is interrupted with Ctrl-C), interrupt the interpreter
+        and wait until it is idle again, for up to ``INTERRUPT_TIMEOUT``
+        seconds.
+
+        Returns:
+            True if the call finished on its own, False if it was interrupted.
+        """
+        try:
+            finished = self._event.wait(timeout)
+        except KeyboardInterrupt:
+            self._interrupt()
+            raise
+        if not finished:
+            self._interrupt()
+        return finished
+
+    cdef _interrupt(self):
+        PY_AMPL_CALL(campl.AMPL_Interrupt(self._ampl._c_ampl))
+        deadline = time.monotonic() + INTERRUPT_TIMEOUT
+        finished = self._event.wait(INTERRUPT_TIMEOUT)
+        while finished and self._ampl.is_busy():
+            finished = time.monotonic() < deadline
+            time.sleep(0.001)
+        if not finished:
+            raise RuntimeError(
+                f"The AMPL interpreter did not stop within {INTERRUPT_TIMEOUT} "
+                "seconds of the interrupt"
+            )
+
+    def _cancelled(self, future):
+        if future.cancelled() and not self._event.is_set():
+            PY_AMPL_CALL(campl.AMPL_Interrupt(self._ampl._c_ampl))
+
+    def _complete(self):
+        # Consume the pending error even if the future was cancelled, so it
+        # does not surface in the next call
+        try:
+            self._ampl._error_handler_wrapper.check()
+        except Exception as exp:
+            if not self._future.done():
+                self._future.set_exception(exp)
+        else:
+            if not self._future.done():
+                self._future.set_result(None)
+
+
+cdef void _async_call_done(void* runnable) noexcept with gil:
+    call = <_AsyncCall>runnable
+    call._ampl._pending_call = None
+    call._event.set()
+    if call._loop is not None:
+        try:
+            call._loop.call_soon_threadsafe(call._complete)
+        except RuntimeError:
+            # The event loop was closed before the call finished
+            pass
+    Py_DECREF(call)
+
+
+cdef class _OutputCollector(OutputHandler):
+    """
+    Output handler that keeps the output instead of displaying it.
+    """
+    cdef list _chunks
+
+    def __cinit__(self):
+        self._chunks = []
+
+    def output(self, kind, msg):
+        self._chunks.append(msg)
+
+    def text(self):
+        return "".join(self._chunks)
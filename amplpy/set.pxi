@@ -32,7 +32,6 @@ cdef class Set(Entity):
     cdef create(AMPL ampl, char* name, campl.AMPL_TUPLE* index, parent):
         entity = Set()
         entity._ampl = ampl
-        Py_INCREF(entity._ampl)
         entity._name = name
         entity._index = index
         entity.wrap_function = campl.AMPL_SET
@@ -134,6 +133,7 @@ cdef class Set(Entity):
         """
         cdef campl.AMPL_ERRORINFO* errorinfo
         cdef DataFrame df = None
+        self._ampl._clear_data_caches()
         if not self.is_scalar():
             if not isinstance(values, dict):
                 raise TypeError("Excepted dictionary of set members for each index.")
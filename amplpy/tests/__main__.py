@@ -9,6 +9,7 @@ from .test_dataframe import TestDataFrame
 from .test_environment import TestEnvironment
 from .test_outputhandler import TestOutputHandler
 from .test_properties import TestProperties
+from .test_pool import TestPool
 
 
 if __name__ == "__main__":
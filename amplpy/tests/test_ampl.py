@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import unittest
+import asyncio
 import shutil
+import time
 import os
 
 import amplpy
@@ -500,6 +502,135 @@ class TestAMPL(TestBase.TestBase):
         self.assertEqual(obj.num_instances(), 1)
         self.assertEqual(s.num_instances(), 1)
 
+    def test_accessors(self):
+        ampl = self.ampl
+        ampl.eval("var x; var y{1..2}; param p; set S;")
+        self.assertIsInstance(ampl.var, amplpy.ampl.Variables)
+        self.assertIsInstance(ampl.option, amplpy.ampl.Options)
+        self.assertIn("x", ampl.var)
+        self.assertNotIn("p", ampl.var)
+        self.assertNotIn("z", ampl.var)
+        self.assertIn("p", ampl.param)
+        ampl.enable_entity_cache()
+        self.assertIn("x", ampl.var)
+        self.assertEqual(ampl.entity_cache_info()["misses"], 0)
+        ampl.enable_entity_cache(False)
+        self.assertEqual(sorted(ampl.var.keys()), ["x", "y"])
+        self.assertEqual(ampl.set.keys(), ["S"])
+        self.assertEqual(ampl.con.items(), [])
+        name, p = ampl.param.items()[0]
+        self.assertEqual(name, "p")
+        ampl.param["p"] = 3
+        self.assertEqual(p.value(), 3)
+        ampl.option["solver"] = "highs"
+        self.assertEqual(ampl.option["solver"], "highs")
+
+    def test_async(self):
+        ampl = self.ampl
+        model = self.str2file("async.mod", "var x >= 1; minimize obj: x;")
+
+        async def run():
+            await ampl.read_async(model)
+            await ampl.eval_async("var y{1..2} >= 2; minimize obj2: obj + sum{i in 1..2} y[i];")
+            await ampl.solve_async("obj2")
+            with self.assertRaises(Exception):
+                await ampl.eval_async("X X;")
+
+        asyncio.run(run())
+        self.assertFalse(ampl.is_busy())
+        self.assertEqual(ampl.get_objective("obj2").value(), 5)
+        with self.assertRaises(RuntimeError):
+            ampl.eval_async("display 1;")
+
+    def test_solve_timeout(self):
+        ampl = self.ampl
+        ampl.eval("var x >= 1; minimize obj: x;")
+        output = ampl.solve(solver="highs", timeout=60, return_output=True)
+        self.assertIn("optimal", output.lower())
+        self.assertEqual(ampl.solve_result, "solved")
+        if os.name == "nt":
+            self.skipTest("the slow solver is a shell script")
+        # A solver that always runs longer than the timeouts below, so the
+        # interrupt path is taken regardless of the speed of the machine
+        solver = self.str2file("slowsolver", "#!/bin/sh\nsleep 5")
+        os.chmod(solver, 0o755)
+        ampl.eval(
+            r"""
+            param n := 2;
+            param w default 0;
+            var y{1..n} binary;
+            maximize total: sum{i in 1..n} y[i];
+            """
+        )
+
+        w = ampl.param["w"]
+
+        async def run():
+            future = ampl.solve_async("total", solver)
+            calls = [
+                lambda: ampl.eval("display 1;"),
+                lambda: ampl.eval_async("display 1;"),
+                lambda: ampl.solve_async("total", solver),
+                lambda: ampl.set_option("presolve", 0),
+                lambda: ampl.get_value("n"),
+                lambda: ampl.param["n"],
+                lambda: "y" in ampl.var,
+                lambda: w.value(),
+                lambda: w.set(1),
+            ]
+            for call in calls:
+                with self.assertRaises(RuntimeError):
+                    call()
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(future, 0.5)
+
+        asyncio.run(run())
+        while ampl.is_busy():
+            time.sleep(0.01)
+        with self.assertRaises(amplpy.SolveTimeoutError) as context:
+            ampl.solve("total", solver, return_output=True, timeout=0.5)
+        self.assertIsInstance(context.exception.output, str)
+        self.assertFalse(ampl.is_busy())
+        self.assertEqual(w.value(), 0)
+
+    def test_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run(k):
+            ampl = amplpy.AMPL()
+            ampl.eval(f"var x >= {k}; minimize obj: x;")
+            ampl.solve(solver="highs", verbose=False)
+            value = ampl.get_value("x")
+            ampl.close()
+            return value
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(list(executor.map(run, range(4))), [0, 1, 2, 3])
+
+    def test_entity_cache(self):
+        ampl = self.ampl
+        ampl.eval("param p{1..3} default 0; var x;")
+        self.assertFalse(ampl.entity_cache_info()["enabled"])
+        ampl.enable_entity_cache()
+        p = ampl.param["p"]
+        self.assertIs(ampl.get_parameter("p"), p)
+        for i in range(1, 4):
+            ampl.param["p"][i] = i
+        self.assertEqual(ampl.get_parameter("p")[3], 3)
+        ampl.get_variable("x")
+        with self.assertRaises(KeyError):
+            ampl.get_variable("p")
+        info = ampl.entity_cache_info()
+        self.assertEqual(info["hits"], 5)
+        self.assertEqual(info["misses"], 3)
+        self.assertEqual(info["size"], 2)
+        ampl.eval("param q;")
+        self.assertEqual(ampl.entity_cache_info()["size"], 0)
+        self.assertIsNot(ampl.get_parameter("p"), p)
+        ampl.enable_entity_cache(False)
+        self.assertEqual(ampl.entity_cache_info()["size"], 0)
+        self.assertIsNot(ampl.get_parameter("p"), ampl.get_parameter("p"))
+
 
 
 if __name__ == "__main__":
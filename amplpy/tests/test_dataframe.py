@@ -15,6 +15,10 @@ try:
     import pandas as pd
 except ImportError:
     pd = None
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 
 class TestDataFrame(TestBase.TestBase):
@@ -277,6 +281,163 @@ class TestDataFrame(TestBase.TestBase):
         self.assertEqual(DataFrame.from_numpy(mat[:, 0]).to_list(), [1, 3, 5])
         self.assertEqual(DataFrame.from_numpy(mat[:, 1]).to_list(), [2, 4, 6])
 
+    def test_to_numpy(self):
+        if np is None:
+            self.skipTest("numpy not available")
+        ampl = self.ampl
+        ampl.eval("param p{i in 1..3, j in 1..2} := i*j/2;")
+        df = ampl.get_data("p")
+        arr = df.to_numpy()
+        self.assertEqual(arr.dtype, np.float64)
+        self.assertEqual(arr.shape, (6, 3))
+        self.assertEqual(arr[:, 2].tolist(), [0.5, 1, 1, 2, 1.5, 3])
+        self.assertEqual(df.to_numpy(skip_index=True).shape, (6, 1))
+        self.assertEqual(df._get_column("p").to_numpy().tolist(), arr[:, 2].tolist())
+        df = DataFrame("x", [("y", ["a", "b"])])
+        df._set_column("x", [1, 2])
+        self.assertEqual(df._get_column("x").to_numpy().dtype, np.float64)
+        self.assertEqual(df._get_column("y").to_numpy().tolist(), ["a", "b"])
+        self.assertEqual(df.to_numpy().tolist(), [[1, "a"], [2, "b"]])
+
+    def test_numpy_buffers(self):
+        if np is None or pd is None:
+            self.skipTest("numpy or pandas not available")
+        mat = np.arange(6, dtype=np.int32).reshape(3, 2)
+        self.assertEqual(
+            DataFrame.from_numpy(mat[:, ::-1]).to_list(), [(1, 0), (3, 2), (5, 4)]
+        )
+        self.assertEqual(DataFrame.from_numpy(np.array([True, False])).to_list(), [1, 0])
+        self.assertEqual(DataFrame.from_numpy(np.array(["a", "b"])).to_list(), ["a", "b"])
+        df = pd.DataFrame(
+            {"a": [1.5, 2, 3], "b": ["x", "y", "z"]},
+            index=pd.MultiIndex.from_tuples([(1, "p"), (2, "q"), (3, "r")]),
+        )
+        self.assertEqual(
+            DataFrame.from_pandas(df).to_list(),
+            [(1, "p", 1.5, "x"), (2, "q", 2, "y"), (3, "r", 3, "z")],
+        )
+        df = DataFrame("x", "y")
+        df._set_column("x", np.array([1, 2, 3]))
+        df._set_column("y", np.array([0.5, 1.5, 2.5]))
+        self.assertEqual(df.to_dict(), {1: 0.5, 2: 1.5, 3: 2.5})
+
+    def test_to_pandas_dtype_backend(self):
+        if pd is None or np is None:
+            self.skipTest("pandas not available")
+        df = DataFrame(
+            index=[("i", [1, 1, 2]), ("j", ["a", "b", "a"])],
+            columns=[("v", [1, 2, 3.5]), ("s", ["x", "y", "z"])],
+        )
+        result = df.to_pandas(dtype_backend="numpy")
+        self.assertEqual(result["v"].dtype, np.float64)
+        self.assertEqual(result["v"].tolist(), [1, 2, 3.5])
+        self.assertEqual(result["s"].tolist(), ["x", "y", "z"])
+        self.assertEqual(result.index.names, ["i", "j"])
+        self.assertEqual(result.index.levels[0].dtype, np.float64)
+        self.assertEqual(result.index.get_level_values(1).dtype, "category")
+        self.assertEqual(result.index.tolist(), [(1, "a"), (1, "b"), (2, "a")])
+        with self.assertRaises(ValueError):
+            df.to_pandas(dtype_backend="unknown")
+        if pa is not None:
+            result = df.to_pandas(dtype_backend="pyarrow")
+            self.assertEqual(result["v"].tolist(), [1, 2, 3.5])
+            self.assertEqual(result.index.tolist(), [(1, "a"), (1, "b"), (2, "a")])
+
+    def test_arrow(self):
+        if pa is None:
+            self.skipTest("pyarrow not available")
+        ampl = self.ampl
+        table = pa.table(
+            {
+                "i": pa.array(["a", "bb", "", "a"]).dictionary_encode(),
+                "j": pa.array([1, 2, 3, 4], type=pa.int32()),
+                "p": [0.5, 1.5, 2.5, 3.5],
+            }
+        )
+        df = DataFrame.from_arrow(table)
+        self.assertEqual(
+            df.to_list(), [("a", 1, 0.5), ("bb", 2, 1.5), ("", 3, 2.5), ("a", 4, 3.5)]
+        )
+        result = df.to_arrow()
+        self.assertEqual(result.column_names, ["i", "j", "p"])
+        self.assertEqual(result.column("i").to_pylist(), ["a", "bb", "", "a"])
+        self.assertEqual(result.column("p").to_pylist(), [0.5, 1.5, 2.5, 3.5])
+        ampl.eval("set I dimen 2; param p{I};")
+        ampl.set_data(df, "I")
+        self.assertEqual(ampl.get_data("p").to_arrow().num_rows, 4)
+        self.assertEqual(
+            ampl.param["p"].to_arrow().column("p").to_pylist(), [0.5, 1.5, 2.5, 3.5]
+        )
+
+    def test_add_rows(self):
+        df = DataFrame(("i", "j"), "v")
+        df.add_rows(((i, f"a{i % 3}", i / 2) for i in range(10)), batch_size=4)
+        self.assertEqual(df._get_num_rows(), 10)
+        self.assertEqual(list(df._get_row_by_index(9)), [9, "a0", 4.5])
+        df.add_rows([(10, "b", None), [11, "c", "x"]])
+        self.assertEqual(df.to_list()[-2:], [(10, "b", None), (11, "c", "x")])
+        self.assertEqual(list(df._get_row((10, "b"))), [10, "b", None])
+        row = df._get_row_by_index(1)
+        column = df._get_column("v")
+        df.add_rows(((i, "d", i) for i in range(12, 15)), batch_size=2)
+        self.assertEqual(list(row), [1, "a1", 0.5])
+        self.assertEqual(column.to_list()[-4:], ["x", 12, 13, 14])
+        df = DataFrame("i", "v")
+        df.add_rows(((i, None if i % 5 == 0 else i) for i in range(20)), batch_size=8)
+        self.assertEqual(df.to_list()[:2], [(0, None), (1, 1)])
+        self.assertEqual(df._get_num_rows(), 20)
+        with self.assertRaises(ValueError):
+            df.add_rows([(1, 2)])
+        df = DataFrame("x")
+        df.add_rows([1, "a", 2.5])
+        self.assertEqual(df.to_list(), [1, "a", 2.5])
+
+    def test_build_index(self):
+        df = DataFrame(("i", "j"), ("v", "w"))
+        df.add_rows([(1, "a", 1.5, 2), (1, "b", 2.5, 3), (2, "a", 3.5, 4)])
+        df.build_index()
+        self.assertEqual(list(df._get_row((2, "a"))), [2, "a", 3.5, 4])
+        rows = df.get_rows([(2, "a"), [1, "a"]])
+        if np is not None:
+            self.assertEqual(rows.dtype, np.float64)
+            rows = rows.tolist()
+        self.assertEqual(rows, [[3.5, 4], [1.5, 2]])
+        with self.assertRaises(KeyError):
+            df.get_rows([(3, "a")])
+        df._add_row(3, "a", 4.5, 5)
+        self.assertEqual(list(df.get_rows([(3, "a")])[0]), [4.5, 5])
+
+    def test_iter_batches(self):
+        if np is None:
+            self.skipTest("numpy not available")
+        df = DataFrame(("i", "j"), "v")
+        df.add_rows([(i, f"a{i % 2}", i / 2) for i in range(10)])
+        batches = list(df.iter_batches(rows=4))
+        self.assertEqual([batch.shape for batch in batches], [(4, 3), (4, 3), (2, 3)])
+        self.assertEqual(batches[-1].tolist(), [[8, "a0", 4], [9, "a1", 4.5]])
+        if pd is not None:
+            batches = list(df.iter_batches(rows=4, format="pandas"))
+            self.assertEqual(sum(len(batch) for batch in batches), 10)
+            self.assertEqual(batches[1]["v"].tolist(), [2, 2.5, 3, 3.5])
+        if pa is not None:
+            batches = list(df.iter_batches(rows=6, format="arrow"))
+            self.assertEqual([batch.num_rows for batch in batches], [6, 4])
+            self.assertEqual(batches[1].column(1).to_pylist(), ["a0", "a1", "a0", "a1"])
+        with self.assertRaises(ValueError):
+            list(df.iter_batches(format="csv"))
+
+    def test_mixed_columns(self):
+        ampl = self.ampl
+        df = DataFrame(index=[("i", [1, "a", 2])], columns=[("v", ["x", 3, None])])
+        df._add_column("w", [1.5, "b", 2])
+        self.assertEqual(df.to_list(), [(1, "x", 1.5), ("a", 3, "b"), (2, None, 2)])
+        df._set_column("v", ["y", 4, "z"])
+        self.assertEqual(df._get_column("v").to_list(), ["y", 4, "z"])
+        ampl.eval("set S; param p{S} symbolic;")
+        ampl.set["S"] = [1, "a", 2]
+        ampl.param["p"] = {1: "x", "a": 3, 2: "10"}
+        self.assertEqual(ampl.param["p"].to_dict(), {1: "x", "a": 3, 2: "10"})
+
     def test_dict(self):
         dic = {"aa": "bb", "c": "a"}
         self.assertEqual(dic, DataFrame.from_dict(dic).to_dict())
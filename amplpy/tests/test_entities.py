@@ -12,6 +12,10 @@ try:
     import pandas as pd
 except ImportError:
     pd = None
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 
 def load_diet_model(ampl):
@@ -138,6 +142,40 @@ class TestEntities(TestBase.TestBase):
         ampl.var["v_scalar"] = np.int64(456)
         self.assertEqual(ampl.var["v_scalar"].value(), 456)
 
+    def test_variable_bulk(self):
+        if np is None:
+            self.skipTest("numpy not available")
+        ampl = self.ampl
+        ampl.eval("var x{i in 1..4, j in {'a', 'b'}} := i;")
+        x = ampl.var["x"]
+        x.set_values_array(x.index_map(), np.arange(8))
+        self.assertEqual(x[3, "b"].value(), 5)
+        x.fix_many([(1, "a"), (4, "b")], [10, 20])
+        self.assertEqual(x[1, "a"].astatus(), "fix")
+        self.assertEqual(x[4, "b"].value(), 20)
+        self.assertEqual(x[2, "a"].astatus(), "in")
+        mask = np.zeros(8, dtype=bool)
+        mask[[2, 3]] = True
+        x.fix_many(mask)
+        self.assertEqual(x[2, "b"].astatus(), "fix")
+        self.assertEqual(x[2, "b"].value(), 3)
+        x.unfix_many(x.index_map())
+        self.assertEqual(x[1, "a"].astatus(), "in")
+        self.assertNotIn("_amplpy_keys", ampl.set)
+        ampl.eval("var y{{'a', 'b', 3}};")
+        ampl.var["y"].fix_many(["b", 3], [1, 2])
+        self.assertEqual(ampl.var["y"]["b"].astatus(), "fix")
+        self.assertEqual(ampl.var["y"]["a"].astatus(), "in")
+        ampl.eval("param _amplpy_keys := 7;")
+        ampl.var["y"].fix_many(["a"])
+        self.assertEqual(ampl.var["y"]["a"].astatus(), "fix")
+        self.assertEqual(ampl.param["_amplpy_keys"].value(), 7)
+        self.assertNotIn("_amplpy_keys1", ampl.set)
+        with self.assertRaises(ValueError):
+            x.set_values_array([(1, "a")], [1, 2])
+        with self.assertRaises(ValueError):
+            x.fix_many(np.ones(3, dtype=bool))
+
     def test_constraint(self):
         load_diet_model(self.ampl)
         ampl = self.ampl
@@ -366,6 +404,316 @@ class TestEntities(TestBase.TestBase):
             },
         )
 
+    def test_parameter_numpy_matrix_labels(self):
+        if np is None:
+            self.skipTest("numpy not available")
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I;
+        set J;
+        set K;
+        param cost{I, J};
+        param flow{I, J, K};
+        """
+        )
+        ampl.set["I"] = ["a", "b"]
+        ampl.set["J"] = [1, 2, 3]
+        ampl.set["K"] = ["x", "y"]
+        values = np.arange(6).reshape(2, 3)
+        ampl.param["cost"].set_values(values[:, ::-1], labels=(["a", "b"], [3, 2, 1]))
+        self.assertEqual(
+            ampl.param["cost"].to_dict(),
+            {
+                ("a", 1): 2,
+                ("a", 2): 1,
+                ("a", 3): 0,
+                ("b", 1): 5,
+                ("b", 2): 4,
+                ("b", 3): 3,
+            },
+        )
+        values = np.arange(12.0).reshape(2, 3, 2)
+        ampl.param["flow"].set_values(values)
+        self.assertEqual(ampl.param["flow"]["b", 3, "y"], 11)
+        ampl.param["flow"].set_values(
+            values * 2, labels=(["b", "a"], [1, 2, 3], ["x", "y"])
+        )
+        self.assertEqual(ampl.param["flow"]["a", 3, "y"], 10)
+        self.assertEqual(ampl.param["flow"]["b", 1, "x"], 0)
+        with self.assertRaises(ValueError):
+            ampl.param["cost"].set_values(values, labels=(["a", "b"], [1, 2, 3]))
+
+    def test_entity_items(self):
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I := {'a', 'b', 'c'};
+        param p{i in I, j in 1..2} := ord(i) * j;
+        var x{i in I} >= 0, <= 4.5, := 1;
+        var y := 2;
+        """
+        )
+        p = ampl.param["p"]
+        self.assertEqual(dict(p.items(chunk_size=4)), p.get_values().to_dict())
+        self.assertEqual(list(p.items())[:2], [(("a", 1), 1), (("a", 2), 2)])
+        x = ampl.var["x"]
+        self.assertEqual(list(x.items(chunk_size=2)), [("a", 1), ("b", 1), ("c", 1)])
+        self.assertEqual(dict(x.items("ub")), {"a": 4.5, "b": 4.5, "c": 4.5})
+        self.assertEqual(list(ampl.var["y"].items()), [((), 2)])
+
+    def test_entity_to_numpy(self):
+        if np is None:
+            self.skipTest("numpy not available")
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I := {'a', 'b'};
+        set J := 1..3;
+        set T := 1..2;
+        param c{i in I, j in J} := j * (if i = 'a' then 1 else 10);
+        set S within {I, J, T} := {('a', 1, 1), ('b', 3, 2)};
+        var x{i in I, j in J, t in T: (i, j, t) in S} := t;
+        """
+        )
+        array, labels = ampl.param["c"].to_numpy()
+        self.assertEqual(array.shape, (2, 3))
+        self.assertEqual(array.tolist(), [[1, 2, 3], [10, 20, 30]])
+        self.assertEqual(labels[0].tolist(), ["a", "b"])
+        self.assertEqual(labels[1].tolist(), [1, 2, 3])
+        array, labels = ampl.var["x"].to_numpy(suffix="val", fill=0)
+        self.assertEqual(array.shape, (2, 3, 2))
+        self.assertEqual(array[0, 0, 0], 1)
+        self.assertEqual(array[1, 2, 1], 2)
+        self.assertEqual(array.sum(), 3)
+        self.assertEqual(labels[1].tolist(), [1, 2, 3])
+        ampl.eval("param d{(i, j, t) in S} := j;")
+        array, labels = ampl.param["d"].to_numpy()
+        self.assertEqual(array.shape, (2, 2, 2))
+        self.assertEqual([axis.tolist() for axis in labels], [["a", "b"], [1, 3], [1, 2]])
+        ampl.eval(
+            r"""
+        set NEXT{i in I} within J := if i = 'a' then {2} else {1, 3};
+        param q{i in I, j in NEXT[i]} := j;
+        """
+        )
+        array, labels = ampl.param["q"].to_numpy(fill=0)
+        self.assertEqual([axis.tolist() for axis in labels], [["a", "b"], [2, 1, 3]])
+        self.assertEqual(array.tolist(), [[2, 0, 0], [0, 1, 3]])
+
+    def test_parameter_polars(self):
+        if pl is None:
+            self.skipTest("polars not available")
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I := {'a', 'b'};
+        set J := 1..2;
+        param p{I, J};
+        param q{J};
+        var x{I, J};
+        """
+        )
+        df = pl.DataFrame(
+            {
+                "i": pl.Series(["a", "a", "b", "b"], dtype=pl.Categorical),
+                "j": [1, 2, 1, 2],
+                "value": [1.5, 2.5, 3.5, 4.5],
+            }
+        )
+        ampl.param["p"].set_values(df)
+        self.assertEqual(ampl.param["p"]["b", 1], 3.5)
+        ampl.var["x"].set_values(df)
+        self.assertEqual(ampl.var["x"]["a", 2].value(), 2.5)
+        ampl.param["q"].set_values(pl.Series([7, 8]))
+        self.assertEqual(ampl.param["q"].to_dict(), {1: 7, 2: 8})
+        result = ampl.param["p"].to_polars()
+        self.assertEqual(result.shape, (4, 3))
+        self.assertEqual(result[:, 2].to_list(), [1.5, 2.5, 3.5, 4.5])
+
+    def test_get_suffix_arrays(self):
+        if np is None:
+            self.skipTest("numpy not available")
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I := {'a', 'b'};
+        set J := 1..2;
+        var x{i in I, j in J} >= j, <= 10 * j := j + 1;
+        """
+        )
+        index, values = ampl.var["x"].get_suffix_arrays(["val", "lb", "ub"])
+        self.assertEqual(index.shape, (4, 2))
+        self.assertEqual(index[:, 0].tolist(), ["a", "a", "b", "b"])
+        self.assertEqual(index[:, 1].tolist(), [1, 2, 1, 2])
+        self.assertEqual(list(values), ["val", "lb", "ub"])
+        self.assertEqual(values["val"].dtype, np.float64)
+        self.assertEqual(values["val"].tolist(), [2, 3, 2, 3])
+        self.assertEqual(values["lb"].tolist(), [1, 2, 1, 2])
+        self.assertEqual(values["ub"].tolist(), [10, 20, 10, 20])
+
+    def test_index_map(self):
+        if np is None:
+            self.skipTest("numpy not available")
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I := {'a', 'b', 'c'};
+        set J := 1..2;
+        param p{I, J} default 0;
+        var x{i in I, j in J} := j;
+        """
+        )
+        p = ampl.param["p"]
+        index_map = p.index_map()
+        self.assertEqual(len(index_map), 6)
+        self.assertEqual(index_map.keys()[:2], [("a", 1), ("a", 2)])
+        self.assertEqual(index_map.position(("b", 1)), 2)
+        p.set_array(index_map, np.arange(6))
+        self.assertEqual(p["c", 2], 5)
+        self.assertEqual(p.get_array(index_map).tolist(), [0, 1, 2, 3, 4, 5])
+        subset = p.index_map([("c", 1), ("a", 2)])
+        p.set_array(subset, [10, 20])
+        self.assertEqual(p.get_array(subset).tolist(), [10, 20])
+        self.assertEqual(p["a", 2], 20)
+        x = ampl.var["x"]
+        self.assertEqual(x.get_array(x.index_map(), "val").tolist(), [1, 2] * 3)
+        with self.assertRaises(ValueError):
+            p.set_array(index_map, [1, 2])
+        with self.assertRaises(ValueError):
+            x.get_array(index_map)
+        with self.assertRaises(KeyError):
+            p.index_map([("d", 1)])
+        with self.assertRaises(TypeError):
+            amplpy.IndexMap()
+        ampl.eval("set K ordered; param q{K} default 0;")
+        ampl.set["K"] = ["a", "b", "c"]
+        q = ampl.param["q"]
+        q_map, q_subset = q.index_map(), q.index_map(["c"])
+        ampl.eval("let K := {'c', 'b', 'a'};")
+        q.set_array(q_map, [4, 5, 6])
+        self.assertEqual(q["a"], 4)
+        self.assertEqual(q.get_array(q_map).tolist(), [4, 5, 6])
+        ampl.get_output("let K := K diff {'a'} union {'d'};")
+        self.assertEqual(q.get_array(q_subset).tolist(), [6])
+        with self.assertRaises(ValueError):
+            q.set_array(q_map, [1, 2, 3])
+
+    def test_find_many(self):
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I ordered;
+        param p{I, 1..2} default 0;
+        """
+        )
+        ampl.set["I"] = ["a", "b"]
+        p = ampl.param["p"]
+        self.assertIsNotNone(p.find(("a", 2)))
+        self.assertIsNone(p.find(("c", 1)))
+        found, missing = p.find_many([("a", 1), ("c", 1), ["b", 2]])
+        self.assertEqual(list(found), [True, False, True])
+        self.assertEqual(list(missing), [False, True, False])
+        ampl.set["I"] = ["a", "c"]
+        self.assertIsNotNone(p.find(("c", 1)))
+        self.assertIsNone(p.find(("b", 1)))
+        ampl.eval("let I := I union {'d'};")
+        self.assertIsNotNone(p.find(("d", 2)))
+        ampl.get_output("let I := I diff {'a'} union {'e'};")
+        self.assertIsNone(p.find(("a", 1)))
+        self.assertEqual(list(p.find_many([("e", 1), ("a", 2)])[0]), [True, False])
+        self.assertEqual(list(ampl.set["I"].find_many(["a", "x"])[0]), [True, False])
+        ampl.eval(
+            r"""
+        param w{1..3} default 0;
+        let w[1] := 1;
+        set A = {i in 1..3: w[i] > 0};
+        param s{A} default 0;
+        """
+        )
+        s = ampl.param["s"]
+        self.assertIsNotNone(s.find(1))
+        ampl.param["w"].set_values({1: 0, 2: 1})
+        self.assertIsNone(s.find(1))
+        self.assertIsNotNone(s.find(2))
+        ampl.param["w"][2] = 0
+        ampl.param["w"][3] = 1
+        self.assertEqual(list(s.find_many([2, 3])[0]), [False, True])
+
+    def test_parameter_get_many(self):
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I := {'a', 'b', 'c'};
+        param p{i in I, j in 1..2} := ord(i) * 10 + j;
+        param q{I} symbolic default 'x';
+        """
+        )
+        p = ampl.param["p"]
+        self.assertEqual(list(p.get_many([("c", 1), ("a", 2)])), [31, 12])
+        self.assertEqual(list(p[[("b", 2), ("b", 1)]]), [22, 21])
+        self.assertEqual(p["b", 2], 22)
+        self.assertEqual(list(ampl.param["q"].get_many(["b", "a"])), ["x", "x"])
+        with self.assertRaises(KeyError):
+            p.get_many([("d", 1)])
+        ampl.eval("param r{i in 1..100} := i / 2;")
+        keys = list(range(100, 0, -1))
+        self.assertEqual(list(ampl.param["r"].get_many(keys)), [i / 2 for i in keys])
+        if np is not None:
+            keys = np.array([["a", "1"], ["c", "2"]], dtype=object)
+            keys[:, 1] = [1, 2]
+            self.assertEqual(p[keys].tolist(), [11.0, 32.0])
+
+    def test_parameter_sync(self):
+        if np is None:
+            self.skipTest("numpy not available")
+        ampl = self.ampl
+        ampl.eval(
+            r"""
+        set I := 1..4;
+        param p{I} default 0;
+        param q{I} default 0;
+        """
+        )
+        p = ampl.param["p"]
+        self.assertEqual(p.sync(np.array([1.0, 2.0, np.nan, 4.0])), 4)
+        self.assertEqual(p.sync(np.array([1.0, 5.0, np.nan, 4.0])), 1)
+        self.assertEqual(p[2], 5)
+        self.assertEqual(p.sync(np.array([1.0, 5.0, np.nan, 4.0])), 0)
+        p[1] = 3
+        self.assertEqual(p.sync(np.array([1.0, 5.0, 6.0, 4.0])), 4)
+        self.assertEqual(p[1], 1)
+        q = ampl.param["q"]
+        self.assertEqual(q.sync({1: 1, 2: 2}), 2)
+        self.assertEqual(q.sync({1: 1, 2: 3}), 1)
+        ampl.eval("let q[2] := 7;")
+        self.assertEqual(q.sync({1: 1, 2: 3}), 2)
+        self.assertEqual(q[2], 3)
+        ampl.get_output("let q[1] := 8;")
+        self.assertEqual(q.sync({1: 1, 2: 3}), 2)
+        self.assertEqual(q[1], 1)
+        self.assertEqual(q.sync({3: float("nan")}), 1)
+        self.assertEqual(q.sync({3: float("nan")}), 0)
+        with self.assertRaises(ValueError):
+            p.sync(np.array([1.0]))
+        ampl.eval(
+            r"""
+        param w{I} default 0;
+        let w[1] := 1;
+        let w[2] := 1;
+        set A = {i in I: w[i] > 0};
+        param r{A} default 0;
+        """
+        )
+        r = ampl.param["r"]
+        r_map = r.index_map()
+        self.assertEqual(r.sync(np.array([1.0, 2.0])), 2)
+        ampl.param["w"].set_values({1: 0, 3: 1})
+        self.assertEqual(r.sync(np.array([1.0, 2.0])), 2)
+        self.assertEqual([r[2], r[3]], [1, 2])
+        with self.assertRaises(ValueError):
+            r.set_array(r_map, [3.0, 4.0])
+
     def test_set_numpy(self):
         if np is None:
             self.skipTest("numpy not available")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+import threading
+import time
+
+import amplpy
+from . import TestBase
+
+
+class TestPool(TestBase.TestBase):
+    """Test AMPLPool."""
+
+    def test_pool_map(self):
+        model = self.str2file(
+            "pool.mod", "param d default 1; var x >= d; minimize cost: x;"
+        )
+
+        def solve(ampl, demand):
+            self.assertEqual(ampl.param["d"].value(), 1)
+            ampl.param["d"] = demand
+            ampl.solve(solver="highs", verbose=False)
+            return ampl.get_value("cost")
+
+        with amplpy.AMPLPool(2, init=model) as pool:
+            self.assertEqual(len(pool), 2)
+            self.assertEqual(pool.map(solve, range(2, 8)), list(range(2, 8)))
+            with pool.session() as ampl:
+                self.assertEqual(ampl.param["d"].value(), 1)
+        with self.assertRaises(RuntimeError):
+            with pool.session():
+                pass
+
+    def test_pool_reset(self):
+        def init(ampl):
+            ampl.eval("set S; data; set S := 1 2; model;")
+
+        with amplpy.AMPLPool(1, init=init, reset="all") as pool:
+            with pool.session() as ampl:
+                ampl.eval("param p{S}; let S := S union {3};")
+            with pool.session() as ampl:
+                self.assertEqual(ampl.set["S"].size(), 2)
+                self.assertNotIn("p", ampl.param)
+        with self.assertRaises(ValueError):
+            amplpy.AMPLPool(1, reset="options")
+        with self.assertRaises(ValueError):
+            amplpy.AMPLPool(0)
+
+    def test_pool_failures(self):
+        calls = []
+
+        def init(ampl):
+            calls.append(ampl)
+            if len(calls) > 1:
+                raise RuntimeError("init failed")
+
+        with self.assertRaises(RuntimeError):
+            amplpy.AMPLPool(2, init=init)
+        calls.clear()
+        with amplpy.AMPLPool(1, init=init) as pool:
+            # Replace the session as if its reset had failed
+            pool._discard(pool._idle.get())
+            pool._idle.put(None)
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    with pool.session():
+                        pass
+            calls.clear()
+            with pool.session() as ampl:
+                self.assertTrue(ampl.is_running())
+
+    def test_pool_close_wakes_waiters(self):
+        errors = []
+
+        def wait(pool):
+            try:
+                with pool.session():
+                    pass
+            except RuntimeError:
+                errors.append(True)
+
+        pool = amplpy.AMPLPool(1)
+        with pool.session():
+            thread = threading.Thread(target=wait, args=(pool,))
+            thread.start()
+            time.sleep(0.1)
+            pool.close()
+            thread.join(5)
+        self.assertEqual(errors, [True])
+
+    def test_template(self):
+        def init(ampl):
+            ampl.eval("set S; param p{S};")
+            ampl.eval("data; set S := 1 2; param p := 1 3 2 4; model;")
+            ampl.option["display_precision"] = 3
+
+        with amplpy.AMPLTemplate(init=init, prespawn=2) as template:
+            sessions = [amplpy.AMPL.from_template(template) for _ in range(3)]
+            for ampl in sessions:
+                self.assertEqual(ampl.set["S"].size(), 2)
+                self.assertEqual(ampl.param["p"][2], 4)
+                self.assertEqual(ampl.option["display_precision"], "3")
+            sessions[0].param["p"][2] = 5
+            self.assertEqual(sessions[1].param["p"][2], 4)
+            for ampl in sessions:
+                ampl.close()
+        with self.assertRaises(RuntimeError):
+            amplpy.AMPL.fromTemplate(template)
+        with self.assertRaises(ValueError):
+            amplpy.AMPLTemplate(init=init, prespawn=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
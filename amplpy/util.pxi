@@ -3,9 +3,10 @@ from cpython.unicode cimport PyUnicode_Check
 from cpython.unicode cimport PyUnicode_AsUTF8
 from cpython.list cimport PyList_GetItem
 from cpython.long cimport PyLong_Check, PyLong_AsLong
-from cpython.float cimport PyFloat_AsDouble
+from cpython.float cimport PyFloat_AsDouble, PyFloat_Check, PyFloat_AS_DOUBLE
 from cpython.object cimport PyObject
 from libcpp cimport bool
+from libc.stdlib cimport calloc
 
 cdef void PY_AMPL_CALL(campl.AMPL_ERRORINFO* errorinfo) except *:
     cdef campl.AMPL_ERRORCODE rc
@@ -129,8 +130,10 @@ cdef campl.AMPL_TUPLE* to_c_tuple(py_tuple):
 
 cdef campl.AMPL_VARIANT* to_c_variant(value)  except *:
     cdef campl.AMPL_VARIANT* variant
-    if isinstance(value, str):
-        campl.AMPL_VariantCreateString(&variant, value.encode('utf-8'))
+    if PyFloat_Check(value):
+        campl.AMPL_VariantCreateNumeric(&variant, PyFloat_AS_DOUBLE(value))
+    elif PyUnicode_Check(value):
+        campl.AMPL_VariantCreateString(&variant, PyUnicode_AsUTF8(value))
     elif isinstance(value, Real):
         campl.AMPL_VariantCreateNumeric(&variant, value)
     elif value is None:
@@ -153,38 +156,13 @@ cdef create_entity(campl.AMPL_ENTITYTYPE entity_class, AMPL ampl, char* name, ca
     else:
         return Entity.create(ampl, name, index, parent)
 
-cdef campl.AMPL_ERRORINFO* setValuesParamNum(campl.AMPL* ampl, char* name, values):
-    cdef campl.AMPL_ERRORINFO* errorinfo
-    cdef size_t size = len(values)
-    cdef double* values_c = <double*> malloc(size * sizeof(double))
-    for i in range(size):
-        values_c[i] = values[i]
-    errorinfo = campl.AMPL_ParameterSetArgsDoubleValues(ampl, name, size, values_c)
-    free(values_c)
-
-    return errorinfo
-
-cdef campl.AMPL_ERRORINFO* setValuesParamStr(campl.AMPL* ampl, char* name, values):
-    cdef campl.AMPL_ERRORINFO* errorinfo
-    cdef size_t size = len(values)
-    cdef char** values_c = <char**> malloc(size * sizeof(char*))
-    for i in range(size):
-        values_c[i] = strdup(values[i].encode('utf-8'))
-    
-    errorinfo = campl.AMPL_ParameterSetArgsStringValues(ampl, name, size, <const char* const*>values_c)
-
-    for i in range(size):
-        free(values_c[i])
-    free(values_c)
-
-    return errorinfo
-
 cdef campl.AMPL_ERRORINFO* setValuesPyDict(campl.AMPL* ampl, char* name, dict dicts) except *:
     cdef campl.AMPL_ERRORINFO* errorinfo
     cdef size_t i
     cdef campl.AMPL_TUPLE** indices_c
     cdef char** values_str_c
     cdef double* values_num_c
+    cdef campl.AMPL_VARIANT** values_c
     cdef PyObject* item
 
     if not PyDict_Check(dicts):
@@ -194,23 +172,9 @@ cdef campl.AMPL_ERRORINFO* setValuesPyDict(campl.AMPL* ampl, char* name, dict di
     cdef object d_values = PyDict_Values(dicts)
     cdef size_t size = len(dicts)
 
-    cdef bool has_numbers = False
-    cdef bool has_strings = False
-
-    for i in range(size):
-        item = PyList_GetItem(d_values, i)
-        if item == NULL:
-            raise ValueError("Failed to access value")
-
-        if PyUnicode_Check(<object>item):
-            has_strings = True
-        else:
-            has_numbers = True
+    cdef int kind = _column_kind(d_values)
 
-        if has_numbers and has_strings:
-            raise ValueError("All values must be either numbers or strings")
-        
-    if has_strings and not has_numbers:
+    if kind == KIND_STRING:
         indices_c = <campl.AMPL_TUPLE**> malloc(size * sizeof(campl.AMPL_TUPLE*))
         values_str_c = <char **> malloc(size * sizeof(char*))
         for i in range(size):
@@ -221,7 +185,7 @@ cdef campl.AMPL_ERRORINFO* setValuesPyDict(campl.AMPL* ampl, char* name, dict di
             campl.AMPL_TupleFree(&indices_c[i])
         free(indices_c)
         free(values_str_c)
-    elif has_numbers and not has_strings:
+    elif kind == KIND_NUMERIC:
         indices_c = <campl.AMPL_TUPLE**> malloc(size * sizeof(campl.AMPL_TUPLE*))
         values_num_c = <double *> malloc(size * sizeof(double))
         for i in range(size):
@@ -237,7 +201,22 @@ cdef campl.AMPL_ERRORINFO* setValuesPyDict(campl.AMPL* ampl, char* name, dict di
         free(indices_c)
         free(values_num_c)
     else:
-        raise ValueError("Dictionary must contain either all strings or all numbers")
+        # Mixed numbers and strings (e.g., symbolic parameters)
+        indices_c = <campl.AMPL_TUPLE**> calloc(size, sizeof(campl.AMPL_TUPLE*))
+        values_c = <campl.AMPL_VARIANT**> calloc(size, sizeof(campl.AMPL_VARIANT*))
+        try:
+            for i in range(size):
+                indices_c[i] = to_c_tuple(<object>PyList_GetItem(d_keys, i))
+                values_c[i] = to_c_variant(<object>PyList_GetItem(d_values, i))
+            errorinfo = campl.AMPL_ParameterSetSomeValues(ampl, name, size, indices_c, values_c)
+        finally:
+            for i in range(size):
+                if indices_c[i] != NULL:
+                    campl.AMPL_TupleFree(&indices_c[i])
+                if values_c[i] != NULL:
+                    campl.AMPL_VariantFree(&values_c[i])
+            free(indices_c)
+            free(values_c)
     return errorinfo
 
 cdef void raiseKeyError(campl.AMPL_ENTITYTYPE entity_class, str name) except *:
@@ -253,3 +232,104 @@ cdef void raiseKeyError(campl.AMPL_ENTITYTYPE entity_class, str name) except *:
         raise KeyError(f"A parameter called {name} cannot be found.")
     else: 
         pass
+
+cdef list _get_instance_values(campl.AMPL* ampl, char* name, campl.AMPL_TUPLE** tuples, size_t size, suffix=None):
+    """
+    Read the values of some instances of an entity one at a time, evaluating
+    the name of each instance (followed by the suffix, if any).
+    """
+    cdef campl.AMPL_ERRORINFO* errorinfo
+    cdef campl.AMPL_VARIANT* v
+    cdef char* name_c
+    cdef size_t i
+    cdef list values = []
+    suffix_b = b"." + suffix.encode('utf-8') if suffix is not None else b""
+    for i in range(size):
+        errorinfo = campl.AMPL_InstanceGetName(ampl, name, tuples[i], &name_c)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+        expression = <bytes>name_c + suffix_b
+        campl.AMPL_StringFree(&name_c)
+        errorinfo = campl.AMPL_GetValue(ampl, expression, &v)
+        if errorinfo:
+            PY_AMPL_CALL(errorinfo)
+        values.append(to_py_variant(v))
+        campl.AMPL_VariantFree(&v)
+    return values
+
+# Below this number of instances, values are read one instance at a time
+# instead of fetching the values of all the instances of the entity
+cdef enum:
+    KEYED_READ_LIMIT = 64
+
+cdef enum:
+    KIND_EMPTY = 0
+    KIND_NUMERIC = 1
+    KIND_STRING = 2
+    KIND_MIXED = 3
+
+
+cdef int _column_kind(values) except -1:
+    """
+    Classify a sequence of values as all numbers, all strings, or mixed
+    (which includes missing values and unsupported types).
+    """
+    cdef int kind = KIND_EMPTY
+    cdef int current
+    for value in values:
+        if PyFloat_Check(value) or PyLong_Check(value):
+            current = KIND_NUMERIC
+        elif PyUnicode_Check(value):
+            current = KIND_STRING
+        elif isinstance(value, Real):
+            current = KIND_NUMERIC
+        else:
+            return KIND_MIXED
+        if kind == KIND_EMPTY:
+            kind = current
+        elif kind != current:
+            return KIND_MIXED
+    return kind
+
+
+cdef class _ArgsBuffer:
+    """
+    Owns the buffer behind an AMPL_ARGS, which only references the values it
+    is created from. Values must be either all numbers or all strings; their
+    kind (see :func:`_column_kind`) can be passed if it is already known.
+    """
+    cdef campl.AMPL_ARGS* _c_args
+    cdef double* _values_num
+    cdef char** _values_str
+    cdef size_t _size
+
+    def __cinit__(self, values, kind=None):
+        cdef size_t i
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        self._size = len(values)
+        if kind is None:
+            kind = _column_kind(values)
+        if kind == KIND_STRING:
+            self._values_str = <char**> malloc(max(self._size, 1) * sizeof(char*))
+            for i in range(self._size):
+                self._values_str[i] = strdup(values[i].encode('utf-8'))
+            campl.AMPL_ArgsCreateString(&self._c_args, <const char* const*>self._values_str)
+        elif kind == KIND_NUMERIC or kind == KIND_EMPTY:
+            self._values_num = <double*> malloc(max(self._size, 1) * sizeof(double))
+            for i in range(self._size):
+                self._values_num[i] = values[i]
+            campl.AMPL_ArgsCreateNumeric(&self._c_args, self._values_num)
+        else:
+            raise ValueError("All values must be either numbers or strings")
+
+    def __dealloc__(self):
+        cdef size_t i
+        if self._c_args != NULL:
+            campl.AMPL_ArgsDestroy(&self._c_args)
+        if self._values_str != NULL:
+            for i in range(self._size):
+                free(self._values_str[i])
+            free(self._values_str)
+        if self._values_num != NULL:
+            free(self._values_num)
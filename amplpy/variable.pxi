@@ -1,4 +1,14 @@
 # -*- coding: utf-8 -*-
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Prefix of the temporary set used by Variable.fix_many and
+# Variable.unfix_many
+_KEYS_SET = "_amplpy_keys"
+
 
 cdef class Variable(Entity):
     """
@@ -24,7 +34,6 @@ cdef class Variable(Entity):
     cdef create(AMPL ampl, char *name, campl.AMPL_TUPLE* index, parent):
         entity = Variable()
         entity._ampl = ampl
-        Py_INCREF(entity._ampl)
         entity._name = name
         entity._index = index
         entity.wrap_function = campl.AMPL_VARIABLE
@@ -40,6 +49,7 @@ cdef class Variable(Entity):
         """
         Get the current value of this variable.
         """
+        self._ampl._check_idle()
         cdef double value
         PY_AMPL_CALL(campl.AMPL_InstanceGetDoubleSuffix(self._ampl._c_ampl, self._name, self._index, campl.AMPL_NUMERICSUFFIX.AMPL_VALUE, &value))
         return value
@@ -52,6 +62,7 @@ cdef class Variable(Entity):
         Args:
             value: value to be set.
         """
+        self._ampl._check_idle()
         if value is None:
             PY_AMPL_CALL(campl.AMPL_VariableInstanceFix(self._ampl._c_ampl, self._name, self._index))
         else:
@@ -61,6 +72,7 @@ cdef class Variable(Entity):
         """
         Unfix all instances of this variable.
         """
+        self._ampl._check_idle()
         PY_AMPL_CALL(campl.AMPL_VariableInstanceUnfix(self._ampl._c_ampl, self._name, self._index))
 
     def set_value(self, value):
@@ -71,11 +83,110 @@ cdef class Variable(Entity):
         Args:
             value: value to be set.
         """
+        self._ampl._check_idle()
         if isinstance(value, Parameter):
             PY_AMPL_CALL(campl.AMPL_VariableInstanceSetValue(self._ampl._c_ampl, self._name, self._index, value.value()))
         else:
             PY_AMPL_CALL(campl.AMPL_VariableInstanceSetValue(self._ampl._c_ampl, self._name, self._index, float(value)))
 
+    def fix_many(self, keys, values=None):
+        """
+        Fix multiple instances of this variable to the values provided, or
+        to their current values otherwise. The keys are sent to AMPL with a
+        single bulk data transfer and fixed with one indexed statement.
+
+        Args:
+            keys: the instances to fix, as an :class:`~amplpy.IndexMap`, an
+            iterable of indices, or a boolean numpy array aligned with the
+            instances of the variable (see :func:`~amplpy.Entity.index_map`).
+
+            values: array (or list) with one value per instance selected.
+        """
+        keys = self._select_keys(keys)
+        if values is not None:
+            self.set_values_array(keys, values)
+        self._eval_instances("fix", keys)
+
+    def unfix_many(self, keys):
+        """
+        Unfix multiple instances of this variable, sending the keys with a
+        single bulk data transfer.
+
+        Args:
+            keys: the instances to unfix, in any of the forms accepted by
+            :func:`~amplpy.Variable.fix_many`.
+        """
+        self._eval_instances("unfix", self._select_keys(keys))
+
+    def set_values_array(self, keys, values):
+        """
+        Set the current values of multiple instances of this variable (e.g.,
+        a warm start) with a single bulk data transfer, equivalent to the
+        AMPL command `let` for each instance.
+
+        Args:
+            keys: the instances to set, in any of the forms accepted by
+            :func:`~amplpy.Variable.fix_many`.
+
+            values: array (or list) with one value per instance selected.
+
+        Raises:
+            ValueError: If the number of values does not match the number
+            of instances selected.
+        """
+        self._ampl._check_idle()
+        keys = self._select_keys(keys)
+        if np is not None:
+            values = np.asarray(values, dtype=np.float64).ravel()
+        else:
+            values = [float(value) for value in values]
+        if len(values) != len(keys):
+            raise ValueError(
+                f"Expected {len(keys)} values, got {len(values)}"
+            )
+        if len(keys) == 0:
+            return
+        if isinstance(keys[0], tuple):
+            index = [(f"index{i}", list(column)) for i, column in enumerate(zip(*keys))]
+        else:
+            index = [("index0", keys)]
+        Entity.set_values(self, DataFrame(index=index, columns=[(self.name(), values)]))
+
+    def _select_keys(self, keys):
+        if isinstance(keys, IndexMap):
+            (<IndexMap>keys)._check_entity(self._name)
+            return keys.keys()
+        if np is not None and isinstance(keys, np.ndarray) and keys.dtype == np.bool_:
+            all_keys = self.index_map().keys()
+            if keys.size != len(all_keys):
+                raise ValueError(
+                    f"Expected a mask with {len(all_keys)} entries, got {keys.size}"
+                )
+            return [all_keys[i] for i in np.flatnonzero(keys)]
+        return [_index_key(key) for key in keys]
+
+    def _eval_instances(self, command, keys):
+        cdef DataFrame df
+        if len(keys) == 0:
+            return
+        arity = self.indexarity()
+        if arity == 1:
+            index = [("_amplpy_k0", list(keys))]
+        else:
+            index = [(f"_amplpy_k{i}", list(column)) for i, column in enumerate(zip(*keys))]
+        df = DataFrame(index=index)
+        dummies = ", ".join(name for name, _ in index)
+        members = dummies if arity == 1 else f"({dummies})"
+        # The keys are loaded into a temporary set with a single data
+        # transfer, and the command is applied to all of them at once
+        set_name = self._ampl._unused_name(_KEYS_SET)
+        self._ampl.eval(f"set {set_name} dimen {arity};")
+        try:
+            self._ampl.set_data(df, set_name)
+            self._ampl.eval(f"{command} {{{members} in {set_name}}} {self.name()}[{dummies}];")
+        finally:
+            self._ampl.eval(f"delete {set_name};")
+
     def astatus(self):
         """
         Get the AMPL status (fixed, presolved, or substituted out).
@@ -266,4 +377,7 @@ cdef class Variable(Entity):
         return value
 
     # Aliases
+    fixMany = fix_many
     setValue = set_value
+    setValuesArray = set_values_array
+    unfixMany = unfix_many
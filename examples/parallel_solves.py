@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def solve_nqueens(model, n, solver):
+    from amplpy import AMPL
+
+    ampl = AMPL()
+    ampl.set_option("solver", solver)
+    ampl.read(model)
+    ampl.param["n"] = n
+    ampl.solve(verbose=False)
+    result = ampl.solve_result
+    ampl.close()
+    return result
+
+
+def main(argc, argv):
+    # You can install amplpy with "python -m pip install amplpy"
+    os.chdir(os.path.dirname(__file__) or os.curdir)
+    model = os.path.join(os.curdir, "models", "nqueens", "nqueens.mod")
+
+    # Number of AMPL instances, size of the board, and solver to use
+    instances = int(argv[1]) if argc > 1 else 4
+    n = int(argv[2]) if argc > 2 else 40
+    solver = argv[3] if argc > 3 else "highs"
+
+    # Solve the instances one after the other
+    start = time.perf_counter()
+    for _ in range(instances):
+        solve_nqueens(model, n, solver)
+    sequential = time.perf_counter() - start
+    print(f"Sequential: {instances} solves in {sequential:.2f}s")
+
+    # Solve the instances from a thread pool: the interpreter calls release
+    # the GIL, so the AMPL objects run in parallel
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=instances) as executor:
+        results = list(
+            executor.map(lambda _: solve_nqueens(model, n, solver), range(instances))
+        )
+    parallel = time.perf_counter() - start
+    print(f"Threads: {instances} solves in {parallel:.2f}s ({results.count('solved')} solved)")
+    print(f"Speedup: {sequential / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    try:
+        main(len(sys.argv), sys.argv)
+    except Exception as e:
+        print(e)
+        raise